@@ -0,0 +1,110 @@
+"""Startup helper for the video backend server.
+
+Picks an ephemeral port, publishes it for the GUI, and serves the FastAPI
+app on the already-bound socket.
+"""
+
+import os
+import socket
+import sys
+from datetime import datetime
+
+
+def bind_and_publish() -> socket.socket:
+    """Bind an ephemeral localhost port and publish it for the GUI.
+
+    The socket is left open so it can be handed straight to uvicorn instead of
+    being closed and re-bound by port number, so no other process can grab the
+    port in between. SO_REUSEADDR is deliberately left unset on it.
+
+    Returns:
+        The bound, listening socket
+    """
+    # Set up logging - write directly to file to avoid stdout redirection issues
+    # Check if we're frozen (packaged executable) - if so, must write to file ourselves
+    if getattr(sys, 'frozen', False):
+        # Running as packaged executable - write logs directly to file
+        log_file_obj = open("/tmp/trailcam_backend.log", "w", buffering=1)
+        sys.stdout = log_file_obj
+        sys.stderr = log_file_obj
+
+    # Find an available ephemeral port (kept open for uvicorn). Listening
+    # before the ready file is written means early GUI connections queue in
+    # the backlog instead of being refused.
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(('127.0.0.1', 0))
+    sock.listen(128)
+    port = sock.getsockname()[1]
+
+    # Write port to file for GUI to read
+    port_file = "/tmp/trailcam_backend_port"
+    with open(port_file, "w") as f:
+        f.write(str(port))
+
+    # Write ready signal
+    ready_file = os.environ.get("TRAILCAM_BACKEND_READY", "/tmp/trailcam_backend_ready")
+    with open(ready_file, "w") as f:
+        f.write(f"ready:{port}\n")
+
+    # Print diagnostics in a single write (goes to stdout, which is file if
+    # frozen or parent's redirect if not)
+    print(
+        f"=== TrailCam Video Backend ===\n"
+        f"Started: {datetime.now()}\n"
+        f"Python: {sys.executable}\n"
+        f"Working dir: {os.getcwd()}\n"
+        f"Frozen: {getattr(sys, 'frozen', False)}\n"
+        f"Bound to port: {port}\n"
+        f"Wrote port to: {port_file}\n"
+        f"Wrote ready signal to: {ready_file}\n"
+        f"Starting uvicorn server on http://127.0.0.1:{port}",
+        flush=True
+    )
+
+    return sock
+
+
+def serve(app, sock: socket.socket):
+    """Serve app on an already-bound socket.
+
+    Args:
+        app: ASGI application to serve
+        sock: Socket returned by bind_and_publish()
+    """
+    import uvicorn
+
+    # Start server (access log off - per-request logging is pure overhead here)
+    config = uvicorn.Config(
+        app,
+        host="127.0.0.1",
+        port=sock.getsockname()[1],
+        log_level="warning",
+        access_log=False,
+        loop="uvloop",
+        http="httptools",
+    )
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def pick_and_serve(app):
+    """Bind an ephemeral localhost port and serve app on it.
+
+    Args:
+        app: ASGI application to serve
+    """
+    serve(app, bind_and_publish())
+
+
+def main():
+    """Backend entry point.
+
+    The port and ready files are written before uvicorn and the FastAPI/OpenCV
+    app are imported, so the GUI is not kept waiting on those imports.
+    """
+    sock = bind_and_publish()
+    from video_backend import app
+    serve(app, sock)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,18 @@ import argparse
 import concurrent.futures as futures
 import csv
 import os
+import shutil
 import sys
 import threading
+from collections import Counter, deque
+from itertools import islice
 from pathlib import Path
-from typing import List, Sequence, Tuple
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
 import cv2
 import numpy as np
 import torch
+from appdirs import user_cache_dir
 from huggingface_hub import hf_hub_download
 from ultralytics import YOLO
 from tqdm import tqdm
@@ -44,8 +48,20 @@ LABEL_MAP = {
 
 _MODEL = None
 _MODEL_LOCK = threading.Lock()
-_PREDICT_LOCK = threading.Lock()  # Ultralytics predictor is not thread-safe for setup/fuse
 _WARMED_UP = False
+_USING_COREML = False
+
+# Number of decoded batches kept in flight ahead of the model
+PREFETCH_BATCHES = 2
+
+FRAME_EXTS = (".jpg", ".jpeg", ".png")
+
+# Model input size; frames are letterboxed to IMGSZ x IMGSZ before inference
+IMGSZ = 640
+LETTERBOX_FILL = 114
+
+# Where CoreML exports of the model are cached between runs
+COREML_CACHE_DIR = Path(user_cache_dir("TrailCamAnimalID", "TrailCamAnimalID"))
 
 
 def normalize_label(raw_label: str) -> str:
@@ -71,15 +87,58 @@ def ensure_model_path() -> str:
     return hf_hub_download(repo_id=MODEL_REPO, filename=MODEL_FILENAME)
 
 
-def load_model(device: str):
-    global _MODEL
-    with _MODEL_LOCK:
-        if _MODEL is None:
-            model_path = ensure_model_path()
-            _MODEL = YOLO(model_path).to(device)
+def ensure_coreml_path(model_path: str) -> Optional[str]:
+    """Return a cached CoreML export of the model, exporting it on first use.
+
+    Returns None (so callers fall back to the PyTorch weights) if the export
+    fails, e.g. because coremltools is not installed.
+    """
+    coreml_path = COREML_CACHE_DIR / f"{Path(model_path).stem}.mlpackage"
+    if coreml_path.exists():
+        return str(coreml_path)
+
+    try:
+        exported = YOLO(model_path).export(format="coreml", half=True, imgsz=IMGSZ)
+    except Exception as e:
+        print(f"CoreML export unavailable, using PyTorch weights: {e}")
+        return None
+
+    COREML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    shutil.move(str(exported), str(coreml_path))
+    return str(coreml_path)
+
+
+def load_model(device: str, use_coreml: bool = False):
+    global _MODEL, _USING_COREML
+    # Double-checked so callers skip the lock once the model is loaded.
+    if _MODEL is None:
+        with _MODEL_LOCK:
+            if _MODEL is None:
+                model_path = ensure_model_path()
+                coreml_path = ensure_coreml_path(model_path) if use_coreml else None
+                if coreml_path:
+                    _MODEL = YOLO(coreml_path, task="detect")
+                    _USING_COREML = True
+                else:
+                    _MODEL = YOLO(model_path).to(device)
     return _MODEL
 
 
+def warmup_model(model, device: str):
+    """Run one dummy predict so predictor setup/fuse happens before real frames."""
+    global _WARMED_UP
+    if _WARMED_UP:
+        return
+    model.predict(
+        to_input_tensor([np.zeros((IMGSZ, IMGSZ, 3), dtype=np.uint8)], device),
+        device=device,
+        verbose=False,
+        imgsz=IMGSZ,
+        half=device != "cpu",
+    )
+    _WARMED_UP = True
+
+
 def map_label(raw_label: str) -> str:
     normalized = normalize_label(raw_label)
     return LABEL_MAP.get(normalized, "other")
@@ -88,38 +147,101 @@ def map_label(raw_label: str) -> str:
 def summarize_labels(labels: Sequence[str]) -> Tuple[str, bool]:
     if not labels:
         return "other", False
-    unique = set(labels)
-    majority = max(unique, key=labels.count)
-    return majority, len(unique) > 1
+    counts = Counter(labels)
+    majority = counts.most_common(1)[0][0]
+    return majority, len(counts) > 1
 
 
-def predict_frame(frame_path: Path, device: str) -> Tuple[str, str, bool]:
+def read_frame(frame_path: Path) -> Optional[np.ndarray]:
+    """Decode a frame and letterbox it to an IMGSZ x IMGSZ RGB array.
+
+    Doing the resize and colour conversion here, once, lets the model skip its
+    own per-image preprocessing when it is handed a ready-made tensor batch.
+    """
     img = cv2.imread(str(frame_path))
     if img is None:
-        return frame_path.name, "other", False
+        return None
+
+    h, w = img.shape[:2]
+    scale = IMGSZ / max(h, w)
+    new_w, new_h = round(w * scale), round(h * scale)
+    if (new_w, new_h) != (w, h):
+        img = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_LINEAR)
+
+    pad_x, pad_y = IMGSZ - new_w, IMGSZ - new_h
+    img = cv2.copyMakeBorder(
+        img,
+        pad_y // 2, pad_y - pad_y // 2,
+        pad_x // 2, pad_x - pad_x // 2,
+        cv2.BORDER_CONSTANT,
+        value=(LETTERBOX_FILL, LETTERBOX_FILL, LETTERBOX_FILL),
+    )
+    return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+
+
+def to_input_tensor(images: Sequence[np.ndarray], device: str) -> torch.Tensor:
+    """Stack letterboxed HWC uint8 images into a normalized NCHW tensor."""
+    batch = torch.from_numpy(np.stack(images)).to(device)
+    batch = batch.half() if device != "cpu" else batch.float()
+    return batch.permute(0, 3, 1, 2).contiguous() / 255.0
 
-    model = load_model(device)
-    # Guard predictor setup/fuse with a lock to avoid race conditions in threads.
-    with _PREDICT_LOCK:
-        results = model.predict(img, device=device, verbose=False)
 
-    labels: List[str] = []
-    for res in results:
-        names = res.names
-        for box in res.boxes:
-            cls_idx = int(box.cls.item())
-            raw_label = names[cls_idx]
-            labels.append(map_label(raw_label))
+def build_class_map(names: Dict[int, str]) -> Dict[int, str]:
+    """Map model class indices straight to canonical labels."""
+    return {idx: map_label(name) for idx, name in names.items()}
 
-    animal, multiple = summarize_labels(labels)
-    return frame_path.name, animal, multiple
 
+def labels_from_result(res, class_map: Dict[int, str]) -> List[str]:
+    # One tensor->list conversion per frame instead of .item() per box
+    return [class_map[cls_idx] for cls_idx in res.boxes.cls.int().tolist()]
 
-def find_frames(frames_dir: Path) -> List[Path]:
-    frames: List[Path] = []
-    for pattern in ("*.jpg", "*.jpeg", "*.png"):
-        frames.extend(sorted(frames_dir.glob(pattern)))
-    return frames
+
+def predict_batch(
+    model,
+    frame_paths: Sequence[Path],
+    images: Sequence[Optional[np.ndarray]],
+    device: str,
+    class_map: Dict[int, str],
+) -> List[Tuple[str, str, bool]]:
+    """Run one batched predict call over frames prepared by read_frame."""
+    rows: List[Tuple[str, str, bool]] = []
+    valid_paths: List[Path] = []
+    valid_imgs = []
+    for frame_path, img in zip(frame_paths, images):
+        if img is None:
+            rows.append((frame_path.name, "other", False))
+        else:
+            valid_paths.append(frame_path)
+            valid_imgs.append(img)
+
+    if not valid_imgs:
+        return rows
+
+    # FP16 halves weight/activation traffic on MPS; CPU kernels stay in FP32.
+    results = model.predict(
+        to_input_tensor(valid_imgs, device),
+        batch=len(valid_imgs),
+        device=device,
+        verbose=False,
+        imgsz=IMGSZ,
+        half=device != "cpu",
+    )
+    for frame_path, res in zip(valid_paths, results):
+        animal, multiple = summarize_labels(labels_from_result(res, class_map))
+        rows.append((frame_path.name, animal, multiple))
+    return rows
+
+
+def iter_frames(frames_dir: Path) -> Iterator[Path]:
+    """Lazily yield frame images in directory order."""
+    with os.scandir(frames_dir) as it:
+        for entry in it:
+            if entry.name.lower().endswith(FRAME_EXTS) and entry.is_file():
+                yield Path(entry.path)
+
+
+def count_frames(frames_dir: Path) -> int:
+    return sum(1 for _ in iter_frames(frames_dir))
 
 
 def parse_args():
@@ -134,7 +256,18 @@ def parse_args():
         "--workers",
         type=int,
         default=max(1, min(4, os.cpu_count() or 1)),
-        help="Number of frames to process in parallel.",
+        help="Number of threads used to decode frames from disk.",
+    )
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=16,
+        help="Number of frames passed to the model in a single predict call.",
+    )
+    parser.add_argument(
+        "--coreml",
+        action="store_true",
+        help="On Apple Silicon, run a cached CoreML export of the model (needs coremltools).",
     )
     return parser.parse_args()
 
@@ -146,29 +279,63 @@ def main():
     output_dir = Path(args.csv_output_dir) if args.csv_output_dir else default_out
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    frames = find_frames(frames_dir)
-    if not frames:
+    total_frames = count_frames(frames_dir)
+    if not total_frames:
         raise SystemExit(f"No frames found in {frames_dir}")
 
     device = "mps" if torch.backends.mps.is_available() else "cpu"
 
-    rows: List[Tuple[str, str, bool]] = []
-    with futures.ThreadPoolExecutor(max_workers=args.workers) as executor:
-        future_map = {executor.submit(predict_frame, frame, device): frame for frame in frames}
-
-        # Use tqdm as context manager to ensure proper cleanup
-        with tqdm(total=len(future_map), desc="Classifying frames") as pbar:
-            for future in futures.as_completed(future_map):
-                rows.append(future.result())  # Properly consume future
-                pbar.update(1)
-
+    model = load_model(device, use_coreml=args.coreml and device == "mps")
+    batch_size = max(1, args.batch_size)
+    if _USING_COREML:
+        # CoreML models take one image per call and run outside torch, so keep
+        # the input tensors on the CPU in FP32 and feed frames singly.
+        device = "cpu"
+        batch_size = 1
+    warmup_model(model, device)
+    class_map = build_class_map(model.names)
+
+    # Frames are pulled lazily a batch at a time, so memory stays bounded by
+    # the prefetch depth rather than growing with the number of frames.
+    frame_iter = iter_frames(frames_dir)
+    batches = iter(lambda: list(islice(frame_iter, batch_size)), [])
+
+    # Rows are streamed into a temporary sibling that only replaces the real CSV
+    # once every batch succeeded; run_pipeline.py treats an existing CSV as done,
+    # so a cancelled or failed run must not leave a partial one behind.
     out_path = output_dir/"animal_predictions.csv"
-    with out_path.open("w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["filename", "animal", "multiple_animals"])
-        writer.writerows(rows)
-
-    print(f"Wrote {len(rows)} rows to {out_path}")
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    row_count = 0
+    try:
+        with tmp_path.open("w", newline="", buffering=1 << 20, encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["filename", "animal", "multiple_animals"])
+
+            # Decoding is I/O-bound and stays threaded, prefetching the next batches
+            # while the model runs on the current one. Prediction runs on this thread
+            # so the predictor never needs a lock.
+            with futures.ThreadPoolExecutor(max_workers=args.workers) as executor:
+                def submit(batch: List[Path]):
+                    return batch, [executor.submit(read_frame, p) for p in batch]
+
+                in_flight = deque(submit(batch) for batch in islice(batches, PREFETCH_BATCHES))
+                with tqdm(total=total_frames, desc="Classifying frames") as pbar:
+                    while in_flight:
+                        batch, pending = in_flight.popleft()
+                        next_batch = next(batches, None)
+                        if next_batch is not None:
+                            in_flight.append(submit(next_batch))
+                        images = [future.result() for future in pending]
+                        rows = predict_batch(model, batch, images, device, class_map)
+                        writer.writerows(rows)
+                        row_count += len(rows)
+                        pbar.update(len(batch))
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, out_path)
+
+    print(f"Wrote {row_count} rows to {out_path}")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,12 @@
 """Cleanup tab for managing pipeline outputs."""
 
 import subprocess
+import threading
 from pathlib import Path
 import customtkinter as ctk
 from tkinter import messagebox
 from send2trash import send2trash
+from gui.dir_size import get_dir_stats
 from gui.config import HEADING_FONT, BODY_FONT, COLORS
 
 
@@ -14,6 +16,7 @@ class CleanupTab:
     def __init__(self, parent, clips_dir_callback):
         self.parent = parent
         self.clips_dir_callback = clips_dir_callback  # Function to get clips dir
+        self._scan_generation = 0  # Bumped per refresh; older scan results are dropped
         self._create_widgets()
 
     def _create_widgets(self):
@@ -81,6 +84,7 @@ class CleanupTab:
 
     def _refresh_info(self):
         output_dir = self._get_output_dir()
+        self._scan_generation += 1
 
         if not output_dir.exists():
             self.info_label.configure(
@@ -89,14 +93,24 @@ class CleanupTab:
             )
             return
 
-        # Calculate directory info
-        total_size = 0
-        total_files = 0
-
-        for item in output_dir.rglob("*"):
-            if item.is_file():
-                total_files += 1
-                total_size += item.stat().st_size
+        # Walk the tree off the Tk thread so large outputs don't freeze the UI
+        self.info_label.configure(text="Scanning...")
+        threading.Thread(target=self._scan_worker, args=(output_dir, self._scan_generation),
+                         daemon=True).start()
+
+    def _scan_worker(self, output_dir: Path, generation: int):
+        try:
+            total_files, total_size = get_dir_stats(output_dir)
+        except OSError:
+            total_files, total_size = 0, 0
+        self.info_label.after(0, self._apply_scan_result, generation, output_dir, total_files, total_size)
+
+    def _apply_scan_result(self, generation: int, output_dir: Path, total_files: int, total_size: int):
+        # A newer refresh (e.g. after deleting the outputs) supersedes this result
+        if generation != self._scan_generation or not output_dir.exists():
+            return
+        if not self.info_label.winfo_exists():
+            return
 
         # Format size
         if total_size < 1024:
@@ -1,8 +1,14 @@
 """Configuration defaults for the TrailCam Animal ID GUI."""
 
 import os
+import sys
+import types
 from pathlib import Path
 
+# Queried once at import; neither changes while the app is running
+_CPU_COUNT = os.cpu_count() or 1
+_DEFAULT_CLIPS_DIR = str(Path.home() / "Desktop")
+
 # Professional fonts (SF Pro Display on macOS, fallback to system default)
 FONT_FAMILY = "SF Pro Display"
 FONT_FAMILY_MONO = "SF Mono"
@@ -16,7 +22,7 @@ MONO_FONT = {"family": FONT_FAMILY_MONO, "size": 11, "weight": "normal"}
 
 # Neon Cyberpunk Color Palette
 # Dark foundations with neon teal accents
-COLORS = {
+_COLORS = {
     # Backgrounds (true black cyberpunk foundation)
     'bg_primary': '#000000',        # True black - main background
     'bg_secondary': '#0a0a0a',      # Near black - panels
@@ -48,20 +54,54 @@ COLORS = {
     'video_border': '#1a1a1a',      # Subtle border
 }
 
+# Read-only view with interned values; the palette is never mutated at runtime
+COLORS = types.MappingProxyType({k: sys.intern(v) for k, v in _COLORS.items()})
+
+# Most-used palette entries as plain constants for widget construction
+BG_PRIMARY = COLORS['bg_primary']
+TEXT_PRIMARY = COLORS['text_primary']
+TEXT_SECONDARY = COLORS['text_secondary']
+UI_BORDER = COLORS['ui_border']
+UI_BORDER_HOVER = COLORS['ui_border_hover']
+
+
+def _workers(env: str, default: int, cap: int = 16) -> int:
+    """Read a worker count override from the environment.
+
+    Args:
+        env: Environment variable name
+        default: Value used when the variable is unset or not an integer
+        cap: Upper bound applied to overrides
+
+    Returns:
+        Worker count clamped to [1, cap], or default
+    """
+    value = os.environ.get(env)
+    try:
+        return max(1, min(cap, int(value))) if value else default
+    except ValueError:
+        return default
+
+
 DEFAULT_CONFIG = {
-    'clips_dir': str(Path.home() / "Desktop"),
+    'clips_dir': _DEFAULT_CLIPS_DIR,
     'frames_per_clip': 4,
-    'frame_workers': min(4, os.cpu_count() or 1),
-    'classify_workers': min(4, os.cpu_count() or 1),
+    # Frame extraction runs one process per worker, each decoding and JPEG
+    # encoding (CPU-bound), so stay at about one per core. Classify workers are
+    # prefetch threads that read and decode JPEGs ahead of the model; they spend
+    # much of their time waiting on disk, so allow more of them. Both are capped
+    # to avoid contention on very wide machines, and can be overridden with
+    # TRAILCAM_FRAME_WORKERS / TRAILCAM_CLASSIFY_WORKERS.
+    'frame_workers': _workers('TRAILCAM_FRAME_WORKERS', min(_CPU_COUNT, 8)),
+    'classify_workers': _workers('TRAILCAM_CLASSIFY_WORKERS', min(2 * _CPU_COUNT, 16)),
     'extensions': '.mp4,.MP4,.mov,.MOV',
     'force': False,
     'play_rate': 4.0,
     'clip_pause_seconds': 2.0,
 }
 
-def get_worker_options() -> list:
+def _compute_worker_options(cpu_count: int) -> tuple:
     """Generate worker count options based on CPU count."""
-    cpu_count = os.cpu_count() or 4
     # Generate: 1, 2, 4, then powers of 2 up to cpu_count, then cpu_count if not power of 2
     options = [1, 2, 4]
 
@@ -79,7 +119,13 @@ def get_worker_options() -> list:
     if cpu_count < 32:
         options.append(min(32, cpu_count * 2))
 
-    return sorted(set(options))
+    return tuple(sorted(set(options)))
+
+WORKER_OPTIONS = _compute_worker_options(_CPU_COUNT)
+
+def get_worker_options() -> tuple:
+    """Return worker count options (precomputed from CPU count at import)."""
+    return WORKER_OPTIONS
 
 FRAMES_PER_CLIP_RANGE = (1, 30)
 PLAY_RATE_RANGE = (0.5, 8.0)
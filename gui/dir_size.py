@@ -0,0 +1,38 @@
+"""Directory size helpers shared by the cleanup views."""
+
+import os
+from pathlib import Path
+from typing import Iterator, Tuple, Union
+
+
+def iter_file_sizes(path: Union[str, Path]) -> Iterator[int]:
+    """Yield the size of every regular file under path (recursively).
+
+    Uses os.scandir so the file type comes from the cached directory entry
+    instead of a separate stat() per item.
+
+    Args:
+        path: Directory to walk
+
+    Yields:
+        File sizes in bytes
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_file_sizes(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry.stat(follow_symlinks=False).st_size
+
+
+def get_dir_stats(path: Union[str, Path]) -> Tuple[int, int]:
+    """Count files and total bytes under a directory.
+
+    Args:
+        path: Directory to walk
+
+    Returns:
+        Tuple of (total_files, total_size_bytes)
+    """
+    sizes = list(iter_file_sizes(path))
+    return len(sizes), sum(sizes)
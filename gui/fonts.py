@@ -0,0 +1,25 @@
+"""Shared CTkFont instances for the TrailCam Animal ID GUI."""
+
+import customtkinter as ctk
+
+_font_cache = {}
+
+
+def get_font(spec: dict) -> ctk.CTkFont:
+    """Return a shared CTkFont for a font spec dict (e.g. BODY_FONT).
+
+    Fonts are created lazily (a Tk root must exist) and reused for every
+    widget that asks for the same spec instead of allocating a new Tk font
+    per widget.
+
+    Args:
+        spec: Font keyword arguments from gui.config
+
+    Returns:
+        Cached CTkFont instance
+    """
+    key = tuple(sorted(spec.items()))
+    font = _font_cache.get(key)
+    if font is None:
+        font = _font_cache[key] = ctk.CTkFont(**spec)
+    return font
@@ -1,16 +1,30 @@
-"""Main window for the TrailCam Animal ID GUI application."""
+"""Main window for the TrailCam Animal ID GUI application.
 
+Screen modules (review tab, pipeline wizard) are imported inside the methods
+that first show them, keeping them off the time-to-first-paint path.
+"""
+
+import threading
 import customtkinter as ctk
 from pathlib import Path
 from gui.session_manager import SessionManager
-from gui.review_tab import ReviewTab
-from gui.pipeline_wizard import PipelineWizard
-from gui.config import TITLE_FONT, HEADING_FONT, BODY_FONT, COLORS, DEFAULT_CONFIG
+from gui.fonts import get_font
+from gui.config import (
+    TITLE_FONT, HEADING_FONT, BODY_FONT, DEFAULT_CONFIG,
+    BG_PRIMARY, TEXT_PRIMARY, TEXT_SECONDARY, UI_BORDER, UI_BORDER_HOVER
+)
 
 
 class TrailCamApp(ctk.CTk):
     """Main application window with Netflix-style single-screen interface."""
 
+    # CTk instances keep a __dict__ for Tk's own attributes, so these slots are
+    # additive: they give the window's own state fixed storage and fast access.
+    __slots__ = (
+        'session', '_clips_dir_str', 'content_frame', '_startup_frame',
+        '_review_frame', 'review_screen', '_toast_after_id', 'status_label',
+    )
+
     def __init__(self):
         super().__init__()
 
@@ -20,7 +34,7 @@ class TrailCamApp(ctk.CTk):
 
         # Set pure black appearance
         ctk.set_appearance_mode("dark")
-        self.configure(fg_color=COLORS['bg_primary'])
+        self.configure(fg_color=BG_PRIMARY)
 
         # Bind window close event to save state
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
@@ -28,59 +42,110 @@ class TrailCamApp(ctk.CTk):
         # Session manager for state tracking
         self.session = SessionManager()
 
+        # Clips directory as a string, refreshed only when the session's directory changes
+        self._clips_dir_str = DEFAULT_CONFIG['clips_dir']
+        self.session.on_clips_directory_changed = self._on_clips_dir_changed
+
         # Set default clips directory if exists
         default_clips_dir = Path(DEFAULT_CONFIG['clips_dir'])
         if default_clips_dir.exists():
             self.session.set_clips_directory(default_clips_dir)
 
         # Main content frame (will hold startup screen or review screen)
-        self.content_frame = ctk.CTkFrame(self, fg_color=COLORS['bg_primary'])
+        self.content_frame = ctk.CTkFrame(self, fg_color=BG_PRIMARY)
         self.content_frame.pack(fill="both", expand=True, padx=10, pady=10)
 
+        # Screen frames are created on first use and then swapped with pack_forget
+        self._startup_frame = None
+        self._review_frame = None
+        self.review_screen = None
+        self._toast_after_id = None
+
         # Status bar
         self.status_label = ctk.CTkLabel(
             self,
             text="Ready",
             anchor="w",
             height=30,
-            fg_color=COLORS['bg_primary'],
-            text_color=COLORS['text_secondary']
+            fg_color=BG_PRIMARY,
+            text_color=TEXT_SECONDARY
         )
         self.status_label.pack(side="bottom", fill="x", padx=10, pady=(0, 5))
 
-        # Load saved state and auto-resume if valid
-        saved_state = self.session.load_state()
+        # Load saved state off the main thread so the window paints immediately
+        self.status_label.configure(text="Loading...")
+        threading.Thread(target=self._bg_load_session, daemon=True).start()
+
+    def _bg_load_session(self):
+        """Read and validate saved state (runs on a worker thread, no Tk calls)."""
+        try:
+            saved_state = self.session.load_state()
+            if not (saved_state and self.session.validate_state(saved_state)):
+                saved_state = None
+        except Exception as e:
+            # A malformed state file must not leave the window stuck on "Loading..."
+            print(f"Ignoring unreadable saved session: {e}")
+            saved_state = None
+        self.after(0, self._on_session_loaded, saved_state)
+
+    def _on_session_loaded(self, saved_state):
+        """Show the first screen once saved state has been loaded.
+
+        Args:
+            saved_state: Validated state dictionary, or None if there is no usable session
+        """
+        self.status_label.configure(text="Ready")
 
-        if saved_state and self.session.validate_state(saved_state):
+        if saved_state:
             # Valid saved session - auto-resume directly to review
             preferences = self.session.restore_from_state(saved_state)
-            self._auto_resume_review(preferences)
+            # validate_state() already confirmed the CSV exists, so skip re-checking
+            self._auto_resume_review(preferences, has_outputs=True)
         else:
             # No valid session - show startup screen
             self._show_startup_screen()
 
     def _show_startup_screen(self):
         """Show startup screen with Resume or New Analysis options."""
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-
-        # Detect if we have existing outputs
-        has_outputs = self.session.has_existing_outputs()
+        if self._startup_frame is None:
+            self._startup_frame = ctk.CTkFrame(self.content_frame, fg_color=BG_PRIMARY)
+        else:
+            # Options depend on current outputs, so only the centered container is rebuilt
+            for widget in self._startup_frame.winfo_children():
+                widget.destroy()
+        self._show_frame(self._startup_frame)
 
-        # Create startup container (centered)
+        # Create startup container; it is placed (centered) only after it is filled
         startup_container = ctk.CTkFrame(
-            self.content_frame,
-            fg_color=COLORS['bg_primary']
+            self._startup_frame,
+            fg_color=BG_PRIMARY
         )
-        startup_container.place(relx=0.5, rely=0.5, anchor="center")
+
+        # Fill it once Tk is idle so the window paints before the content is built
+        self.after_idle(self._populate_startup_screen, startup_container)
+
+    def _populate_startup_screen(self, startup_container):
+        """Build the startup screen widgets, then place the container in one pass.
+
+        Args:
+            startup_container: Frame created by _show_startup_screen
+        """
+        if not startup_container.winfo_exists():
+            return
+
+        # Palette entries used throughout this builder, bound as locals
+        bg_primary, text_primary, text_secondary = BG_PRIMARY, TEXT_PRIMARY, TEXT_SECONDARY
+        ui_border, ui_border_hover = UI_BORDER, UI_BORDER_HOVER
+
+        # Detect if we have existing outputs
+        has_outputs = self.session.has_existing_outputs()
 
         # App title
         ctk.CTkLabel(
             startup_container,
             text="TrailCam Animal ID",
-            font=ctk.CTkFont(**TITLE_FONT),
-            text_color=COLORS['text_primary']
+            font=get_font(TITLE_FONT),
+            text_color=text_primary
         ).pack(pady=(0, 40))
 
         if has_outputs:
@@ -92,8 +157,8 @@ class TrailCamApp(ctk.CTk):
             ctk.CTkLabel(
                 startup_container,
                 text=info_text,
-                font=ctk.CTkFont(**BODY_FONT),
-                text_color=COLORS['text_secondary']
+                font=get_font(BODY_FONT),
+                text_color=text_secondary
             ).pack(pady=(0, 20))
 
             # Resume button (large, primary)
@@ -103,17 +168,17 @@ class TrailCamApp(ctk.CTk):
                 command=self._resume_review,
                 width=300,
                 height=60,
-                font=ctk.CTkFont(**HEADING_FONT),
-                fg_color=COLORS['bg_primary'],
-                border_color=COLORS['ui_border'],
+                font=get_font(HEADING_FONT),
+                fg_color=bg_primary,
+                border_color=ui_border,
                 border_width=2,
-                text_color=COLORS['text_primary']
+                text_color=text_primary
             )
             resume_btn.pack(pady=10)
 
             # Hover effects - border only
-            resume_btn.bind("<Enter>", lambda e: resume_btn.configure(border_color=COLORS['ui_border_hover']))
-            resume_btn.bind("<Leave>", lambda e: resume_btn.configure(border_color=COLORS['ui_border']))
+            resume_btn.bind("<Enter>", lambda e: resume_btn.configure(border_color=ui_border_hover))
+            resume_btn.bind("<Leave>", lambda e: resume_btn.configure(border_color=ui_border))
 
             # New Analysis button (smaller, secondary)
             new_analysis_btn = ctk.CTkButton(
@@ -122,25 +187,25 @@ class TrailCamApp(ctk.CTk):
                 command=self._start_new_analysis,
                 width=300,
                 height=40,
-                font=ctk.CTkFont(**BODY_FONT),
-                fg_color=COLORS['bg_primary'],
-                border_color=COLORS['ui_border'],
+                font=get_font(BODY_FONT),
+                fg_color=bg_primary,
+                border_color=ui_border,
                 border_width=1,
-                text_color=COLORS['text_primary']
+                text_color=text_primary
             )
             new_analysis_btn.pack(pady=10)
 
             # Hover effects - border only
-            new_analysis_btn.bind("<Enter>", lambda e: new_analysis_btn.configure(border_color=COLORS['ui_border_hover']))
-            new_analysis_btn.bind("<Leave>", lambda e: new_analysis_btn.configure(border_color=COLORS['ui_border']))
+            new_analysis_btn.bind("<Enter>", lambda e: new_analysis_btn.configure(border_color=ui_border_hover))
+            new_analysis_btn.bind("<Leave>", lambda e: new_analysis_btn.configure(border_color=ui_border))
 
         else:
             # Show New Analysis option (primary)
             ctk.CTkLabel(
                 startup_container,
                 text="Analyze your trail camera videos",
-                font=ctk.CTkFont(**BODY_FONT),
-                text_color=COLORS['text_secondary']
+                font=get_font(BODY_FONT),
+                text_color=text_secondary
             ).pack(pady=(0, 20))
 
             # New Analysis button (large, primary)
@@ -150,20 +215,26 @@ class TrailCamApp(ctk.CTk):
                 command=self._start_new_analysis,
                 width=300,
                 height=60,
-                font=ctk.CTkFont(**HEADING_FONT),
-                fg_color=COLORS['bg_primary'],
-                border_color=COLORS['ui_border'],
+                font=get_font(HEADING_FONT),
+                fg_color=bg_primary,
+                border_color=ui_border,
                 border_width=2,
-                text_color=COLORS['text_primary']
+                text_color=text_primary
             )
             new_analysis_primary_btn.pack(pady=10)
 
             # Hover effects - border only
-            new_analysis_primary_btn.bind("<Enter>", lambda e: new_analysis_primary_btn.configure(border_color=COLORS['ui_border_hover']))
-            new_analysis_primary_btn.bind("<Leave>", lambda e: new_analysis_primary_btn.configure(border_color=COLORS['ui_border']))
+            new_analysis_primary_btn.bind("<Enter>", lambda e: new_analysis_primary_btn.configure(border_color=ui_border_hover))
+            new_analysis_primary_btn.bind("<Leave>", lambda e: new_analysis_primary_btn.configure(border_color=ui_border))
+
+        # Settle the container's requested size once, then center it with a single place()
+        startup_container.update_idletasks()
+        startup_container.place(relx=0.5, rely=0.5, anchor="center")
 
     def _start_new_analysis(self):
         """Show pipeline wizard for new analysis."""
+        from gui.pipeline_wizard import PipelineWizard
+
         wizard = PipelineWizard(
             self,
             self.session,
@@ -173,7 +244,8 @@ class TrailCamApp(ctk.CTk):
 
     def _resume_review(self):
         """Resume review from last session."""
-        self._show_review_screen(resume=True)
+        # Only offered on the startup screen when outputs exist
+        self._show_review_screen(resume=True, has_outputs=True)
 
     def _on_wizard_complete(self, skip_pipeline):
         """Handle wizard completion.
@@ -184,26 +256,65 @@ class TrailCamApp(ctk.CTk):
         # Wizard completed - show review screen
         self._show_review_screen(resume=True)
 
-    def _show_review_screen(self, resume=False):
+    def _on_clips_dir_changed(self, directory):
+        """Refresh the cached clips directory string.
+
+        Args:
+            directory: New clips directory, or None to fall back to the default
+        """
+        self._clips_dir_str = str(directory) if directory else DEFAULT_CONFIG['clips_dir']
+
+    def _get_clips_dir(self) -> str:
+        """Return the current clips directory (used as ReviewTab's callback)."""
+        return self._clips_dir_str
+
+    def _show_frame(self, frame):
+        """Pack one screen frame into the content area and hide the others.
+
+        Args:
+            frame: Screen frame to show (startup or review)
+        """
+        for other in (self._startup_frame, self._review_frame):
+            if other is not None and other is not frame:
+                other.pack_forget()
+        if not frame.winfo_ismapped():
+            frame.pack(fill="both", expand=True)
+
+    def _ensure_review_screen(self, preferences=None):
+        """Create the review tab on first use, otherwise re-apply preferences.
+
+        Args:
+            preferences: Dictionary of user preferences, or None for defaults
+        """
+        from gui.review_tab import ReviewTab
+
+        if self.review_screen is None:
+            self._review_frame = ctk.CTkFrame(self.content_frame, fg_color=BG_PRIMARY)
+            self.review_screen = ReviewTab(
+                self._review_frame,
+                clips_dir_callback=self._get_clips_dir,
+                session_manager=self.session,
+                preferences=preferences
+            )
+        elif preferences:
+            self.review_screen.refresh_preferences(preferences)
+        self._show_frame(self._review_frame)
+
+    def _show_review_screen(self, resume=False, has_outputs=None):
         """Show main review screen.
 
         Args:
             resume: If True, load from last session index
+            has_outputs: Known result of session.has_existing_outputs(), or None to check
         """
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-
-        # Create review screen using existing ReviewTab component
+        # Reuse the review screen if it was already built
         # (Will be refactored to ReviewScreen in later iterations)
-        self.review_screen = ReviewTab(
-            self.content_frame,
-            clips_dir_callback=lambda: str(self.session.clips_directory) if self.session.clips_directory else DEFAULT_CONFIG['clips_dir'],
-            session_manager=self.session
-        )
+        self._ensure_review_screen()
 
         # Auto-load clips if resuming
-        if resume and self.session.has_existing_outputs():
+        if resume and has_outputs is None:
+            has_outputs = self.session.has_existing_outputs()
+        if resume and has_outputs:
             self.review_screen._load_clips()
             # Jump to last clip index if available
             if self.session.current_clip_index > 0 and self.session.current_clip_index < len(self.review_screen.clips):
@@ -211,26 +322,31 @@ class TrailCamApp(ctk.CTk):
 
         self.update_status("Review mode active")
 
-    def _auto_resume_review(self, preferences: dict):
+    def _auto_resume_review(self, preferences: dict, has_outputs=None):
         """Auto-resume review screen from saved state.
 
         Args:
             preferences: Dictionary of user preferences from saved state
+            has_outputs: Known result of session.has_existing_outputs(), or None to check
         """
-        # Clear content frame
-        for widget in self.content_frame.winfo_children():
-            widget.destroy()
-
-        # Create review tab with saved preferences
-        self.review_screen = ReviewTab(
-            self.content_frame,
-            clips_dir_callback=lambda: str(self.session.clips_directory) if self.session.clips_directory else DEFAULT_CONFIG['clips_dir'],
-            session_manager=self.session,
-            preferences=preferences
-        )
+        # Show status right away; build the review widgets once Tk is idle
+        self.status_label.configure(text="Resuming session...")
+        self.after_idle(self._build_review_widgets, preferences, has_outputs)
+
+    def _build_review_widgets(self, preferences: dict, has_outputs=None):
+        """Create the review tab for an auto-resumed session.
+
+        Args:
+            preferences: Dictionary of user preferences from saved state
+            has_outputs: Known result of session.has_existing_outputs(), or None to check
+        """
+        # Create (or refresh) review tab with saved preferences
+        self._ensure_review_screen(preferences)
 
         # Auto-load clips from saved session
-        if self.session.has_existing_outputs():
+        if has_outputs is None:
+            has_outputs = self.session.has_existing_outputs()
+        if has_outputs:
             self.review_screen._load_clips()
             # Jump to last clip index if available
             if self.session.current_clip_index >= 0 and self.session.current_clip_index < len(self.review_screen.clips):
@@ -239,41 +355,21 @@ class TrailCamApp(ctk.CTk):
         # Show brief toast notification
         self.status_label.configure(
             text=f"Resumed at clip {self.session.current_clip_index + 1}",
-            text_color=COLORS['text_primary']
+            text_color=TEXT_PRIMARY
         )
 
-        # Clear toast after 3 seconds
-        self.after(3000, lambda: self.status_label.configure(
-            text="Ready",
-            text_color=COLORS['text_secondary']
-        ))
+        # Clear toast after 3 seconds (replacing any pending clear)
+        if self._toast_after_id:
+            self.after_cancel(self._toast_after_id)
+        self._toast_after_id = self.after(3000, self._clear_toast)
 
-    def _show_pipeline_wizard(self):
-        """Show pipeline wizard modal.
-
-        Modal wizard with steps:
-        1. Select directory
-        2. Configure settings
-        3. Run pipeline
-        4. Auto-transition to review
-        """
-        # TODO: Implement in Phase 2
-        pass
-
-    def _show_cleanup_modal(self):
-        """Show cleanup modal for pipeline outputs."""
-        # TODO: Implement in Phase 4
-        pass
-
-    def _show_advanced_menu(self):
-        """Show dropdown menu with advanced options."""
-        # TODO: Implement in Phase 6
-        # Menu items:
-        # - Start New Analysis
-        # - Pipeline Cleanup
-        # - Open Output Folder
-        # - About
-        pass
+    def _clear_toast(self):
+        """Reset the status bar after a toast notification."""
+        self._toast_after_id = None
+        self.status_label.configure(
+            text="Ready",
+            text_color=TEXT_SECONDARY
+        )
 
     def update_status(self, message: str):
         """Update the status bar message.
@@ -285,13 +381,18 @@ class TrailCamApp(ctk.CTk):
 
     def _on_closing(self):
         """Handle window close event - save state before quitting."""
-        # Save state if review screen exists
-        if hasattr(self, 'review_screen') and self.review_screen:
+        # Save state if review screen exists and something changed since the last save
+        if self.review_screen and self.session.dirty:
             try:
                 preferences = self.review_screen._get_preferences()
                 self.session.save_state(preferences)
             except:
                 pass  # Silent fail if save fails
 
+        # Cancel pending toast so it doesn't fire on a destroyed label
+        if self._toast_after_id:
+            self.after_cancel(self._toast_after_id)
+            self._toast_after_id = None
+
         # Destroy window
         self.destroy()
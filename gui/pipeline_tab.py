@@ -1,19 +1,46 @@
 """Pipeline configuration and execution tab."""
 
+import hashlib
+import json
+import os
+import shlex
 import sys
+from collections import deque
+from itertools import islice
+import tkinter as tk
 import customtkinter as ctk
 from tkinter import filedialog
 from pathlib import Path
-from gui.process_runner import ProcessRunner
+from appdirs import user_config_dir
+from gui.process_runner import ProcessRunner, PROGRESS_PCT_RE, PROGRESS_FRAC_RE
+from gui.fonts import get_font
 from gui.config import (
     DEFAULT_CONFIG, get_worker_options, FRAMES_PER_CLIP_RANGE,
     TITLE_FONT, HEADING_FONT, BODY_FONT, MONO_FONT, COLORS
 )
 
 
+# Key of the last successful pipeline run, used to skip identical re-runs
+LAST_RUN_PATH = Path(user_config_dir("TrailCamAnimalID", "TrailCamAnimalID")) / "last_run.json"
+
+# Shared styling for the three directory "Browse..." buttons
+BROWSE_KW = dict(
+    text="Browse...",
+    width=100,
+    fg_color=COLORS['bg_primary'],
+    border_color=COLORS['ui_border'],
+    border_width=1,
+    text_color=COLORS['text_primary']
+)
+
+
 class PipelineTab:
     """Tab for configuring and running the pipeline."""
 
+    # Output directories already created in this process (the pipeline scripts
+    # also create them, so a stale entry only skips a redundant mkdir)
+    _ensured_dirs = set()
+
     def __init__(self, parent):
         self.parent = parent
         self.runner = None
@@ -28,8 +55,33 @@ class PipelineTab:
         self.classify_workers_var = ctk.IntVar(value=DEFAULT_CONFIG['classify_workers'])
         self.force_var = ctk.BooleanVar(value=DEFAULT_CONFIG['force'])
 
+        # Changing an output directory invalidates the ensured-dirs cache
+        for var in (self.frames_dir_var, self.detection_dir_var):
+            var.trace_add("write", lambda *_: self._ensured_dirs.clear())
+
+        # Worker count choices as menu strings, shared by both option menus
+        self._worker_str_options = tuple(str(w) for w in get_worker_options())
+
         # UI state
         self.is_running = False
+        self._exec_built = False  # Progress bar and log are created on first run
+
+        # Authoritative log (last LOG_MAX_LINES entries); the textbox only mirrors it
+        self._log_lines = deque(maxlen=self.LOG_MAX_LINES)
+        self._log_dirty = False
+        self._refresh_scheduled = False
+        # Log viewport: first buffered line shown, and whether it tracks the tail
+        self._log_start = 0
+        self._log_follow = True
+
+        # Key of the run in progress, recorded once it completes successfully
+        self._pending_run_key = None
+        # Exit code set by the reader thread; applied by the drain tick once the
+        # run's remaining output has been logged
+        self._exit_code = None
+
+        # Pending frames-per-clip label update while the slider is dragged
+        self._slider_after_id = None
 
         # Create widgets
         self._create_widgets()
@@ -46,98 +98,41 @@ class PipelineTab:
         ctk.CTkLabel(
             input_frame,
             text="Pipeline Configuration",
-            font=ctk.CTkFont(**TITLE_FONT)
+            font=get_font(TITLE_FONT)
         ).grid(row=0, column=0, columnspan=3, sticky="w", padx=10, pady=(10, 15))
 
-        # Clips Directory
-        ctk.CTkLabel(
-            input_frame,
-            text="Clips Directory:",
-            font=ctk.CTkFont(**BODY_FONT)
-        ).grid(row=1, column=0, sticky="w", padx=10, pady=5)
-
-        self.clips_entry = ctk.CTkEntry(
-            input_frame,
-            textvariable=self.clips_dir_var,
-            width=500
-        )
-        self.clips_entry.grid(row=1, column=1, padx=10, pady=5)
-
-        clips_browse_btn = ctk.CTkButton(
-            input_frame,
-            text="Browse...",
-            command=self._browse_clips,
-            width=100,
-            fg_color=COLORS['bg_primary'],
-            border_color=COLORS['ui_border'],
-            border_width=1,
-            text_color=COLORS['text_primary']
-        )
-        clips_browse_btn.grid(row=1, column=2, padx=10, pady=5)
-        clips_browse_btn.bind("<Enter>", lambda e: clips_browse_btn.configure(border_color=COLORS['ui_border_hover']))
-        clips_browse_btn.bind("<Leave>", lambda e: clips_browse_btn.configure(border_color=COLORS['ui_border']))
-
-        # Frames Directory
-        ctk.CTkLabel(
-            input_frame,
-            text="Frames Directory:",
-            font=ctk.CTkFont(**BODY_FONT)
-        ).grid(row=2, column=0, sticky="w", padx=10, pady=5)
-
-        self.frames_entry = ctk.CTkEntry(
-            input_frame,
-            textvariable=self.frames_dir_var,
-            width=500
+        # Directory rows: label, entry and Browse button for each path
+        dir_rows = (
+            ("Clips Directory:", "clips_entry", self.clips_dir_var, self._browse_clips),
+            ("Frames Directory:", "frames_entry", self.frames_dir_var, self._browse_frames),
+            ("Output Directory:", "detection_entry", self.detection_dir_var, self._browse_detection),
         )
-        self.frames_entry.grid(row=2, column=1, padx=10, pady=5)
-
-        frames_browse_btn = ctk.CTkButton(
-            input_frame,
-            text="Browse...",
-            command=self._browse_frames,
-            width=100,
-            fg_color=COLORS['bg_primary'],
-            border_color=COLORS['ui_border'],
-            border_width=1,
-            text_color=COLORS['text_primary']
-        )
-        frames_browse_btn.grid(row=2, column=2, padx=10, pady=5)
-        frames_browse_btn.bind("<Enter>", lambda e: frames_browse_btn.configure(border_color=COLORS['ui_border_hover']))
-        frames_browse_btn.bind("<Leave>", lambda e: frames_browse_btn.configure(border_color=COLORS['ui_border']))
-
-        # Detection Directory
-        ctk.CTkLabel(
-            input_frame,
-            text="Output Directory:",
-            font=ctk.CTkFont(**BODY_FONT)
-        ).grid(row=3, column=0, sticky="w", padx=10, pady=5)
-
-        self.detection_entry = ctk.CTkEntry(
-            input_frame,
-            textvariable=self.detection_dir_var,
-            width=500
-        )
-        self.detection_entry.grid(row=3, column=1, padx=10, pady=5)
-
-        detection_browse_btn = ctk.CTkButton(
-            input_frame,
-            text="Browse...",
-            command=self._browse_detection,
-            width=100,
-            fg_color=COLORS['bg_primary'],
-            border_color=COLORS['ui_border'],
-            border_width=1,
-            text_color=COLORS['text_primary']
-        )
-        detection_browse_btn.grid(row=3, column=2, padx=10, pady=5)
-        detection_browse_btn.bind("<Enter>", lambda e: detection_browse_btn.configure(border_color=COLORS['ui_border_hover']))
-        detection_browse_btn.bind("<Leave>", lambda e: detection_browse_btn.configure(border_color=COLORS['ui_border']))
+        body_font = get_font(BODY_FONT)
+        for row, (label_text, entry_attr, var, browse_cmd) in enumerate(dir_rows, start=1):
+            ctk.CTkLabel(
+                input_frame,
+                text=label_text,
+                font=body_font
+            ).grid(row=row, column=0, sticky="w", padx=10, pady=5)
+
+            entry = ctk.CTkEntry(
+                input_frame,
+                textvariable=var,
+                width=500
+            )
+            entry.grid(row=row, column=1, padx=10, pady=5)
+            setattr(self, entry_attr, entry)
+
+            browse_btn = ctk.CTkButton(input_frame, command=browse_cmd, **BROWSE_KW)
+            browse_btn.grid(row=row, column=2, padx=10, pady=5)
+            browse_btn.bind("<Enter>", lambda e, b=browse_btn: b.configure(border_color=COLORS['ui_border_hover']))
+            browse_btn.bind("<Leave>", lambda e, b=browse_btn: b.configure(border_color=COLORS['ui_border']))
 
         # Video Extensions
         ctk.CTkLabel(
             input_frame,
             text="Video Extensions:",
-            font=ctk.CTkFont(**BODY_FONT)
+            font=get_font(BODY_FONT)
         ).grid(row=4, column=0, sticky="w", padx=10, pady=5)
 
         ctk.CTkEntry(
@@ -153,13 +148,13 @@ class PipelineTab:
         ctk.CTkLabel(
             frames_label_frame,
             text="Frames per Clip:",
-            font=ctk.CTkFont(**BODY_FONT)
+            font=get_font(BODY_FONT)
         ).pack(side="left")
 
         self.frames_value_label = ctk.CTkLabel(
             frames_label_frame,
             text=str(self.frames_per_clip_var.get()),
-            font=ctk.CTkFont(**HEADING_FONT),
+            font=get_font(HEADING_FONT),
             width=30  # Fixed width for up to 2 digits
         )
         self.frames_value_label.pack(side="left", padx=5)
@@ -180,16 +175,15 @@ class PipelineTab:
         ctk.CTkLabel(
             input_frame,
             text="Frame Workers:",
-            font=ctk.CTkFont(**BODY_FONT)
+            font=get_font(BODY_FONT)
         ).grid(row=6, column=0, sticky="w", padx=10, pady=5)
 
-        worker_options = get_worker_options()
         frame_workers_border = ctk.CTkFrame(input_frame, fg_color=COLORS['ui_border'], corner_radius=6)
         frame_workers_border.grid(row=6, column=1, sticky="w", padx=10, pady=5)
         ctk.CTkOptionMenu(
             frame_workers_border,
             variable=self.frame_workers_var,
-            values=[str(w) for w in worker_options],
+            values=self._worker_str_options,
             width=198,
             fg_color=COLORS['bg_primary'],
             button_color=COLORS['ui_border'],
@@ -205,7 +199,7 @@ class PipelineTab:
         ctk.CTkLabel(
             input_frame,
             text="Classify Workers:",
-            font=ctk.CTkFont(**BODY_FONT)
+            font=get_font(BODY_FONT)
         ).grid(row=7, column=0, sticky="w", padx=10, pady=5)
 
         classify_workers_border = ctk.CTkFrame(input_frame, fg_color=COLORS['ui_border'], corner_radius=6)
@@ -213,7 +207,7 @@ class PipelineTab:
         ctk.CTkOptionMenu(
             classify_workers_border,
             variable=self.classify_workers_var,
-            values=[str(w) for w in worker_options],
+            values=self._worker_str_options,
             width=198,
             fg_color=COLORS['bg_primary'],
             button_color=COLORS['ui_border'],
@@ -230,7 +224,7 @@ class PipelineTab:
             input_frame,
             text="Force re-run even if outputs exist",
             variable=self.force_var,
-            font=ctk.CTkFont(**BODY_FONT),
+            font=get_font(BODY_FONT),
             fg_color=COLORS['text_secondary'],
             border_color=COLORS['text_secondary'],
             border_width=1,
@@ -242,12 +236,13 @@ class PipelineTab:
         # Execution Frame
         exec_frame = ctk.CTkFrame(self.parent, fg_color=COLORS['bg_primary'])
         exec_frame.pack(padx=20, pady=10, fill="both", expand=True)
+        self.exec_frame = exec_frame
 
         # Title
         ctk.CTkLabel(
             exec_frame,
             text="Pipeline Execution",
-            font=ctk.CTkFont(**TITLE_FONT)
+            font=get_font(TITLE_FONT)
         ).pack(padx=10, pady=(10, 5), anchor="w")
 
         # Button Frame
@@ -260,7 +255,7 @@ class PipelineTab:
             command=self._run_pipeline,
             width=150,
             height=40,
-            font=ctk.CTkFont(**HEADING_FONT),
+            font=get_font(HEADING_FONT),
             fg_color=COLORS['bg_primary'],
             border_color=COLORS['ui_border'],
             border_width=1,
@@ -277,7 +272,7 @@ class PipelineTab:
             width=150,
             height=40,
             state="disabled",
-            font=ctk.CTkFont(**HEADING_FONT),
+            font=get_font(HEADING_FONT),
             fg_color=COLORS['bg_primary'],
             border_color=COLORS['ui_border'],
             border_width=1,
@@ -287,6 +282,13 @@ class PipelineTab:
         self.cancel_button.bind("<Enter>", lambda e: self.cancel_button.configure(border_color=COLORS['accent_danger']) if self.cancel_button.cget("state") == "normal" else None)
         self.cancel_button.bind("<Leave>", lambda e: self.cancel_button.configure(border_color=COLORS['ui_border']) if self.cancel_button.cget("state") == "normal" else None)
 
+    def _ensure_exec_widgets(self):
+        """Create the progress bar, step label and log on the first pipeline run."""
+        if self._exec_built:
+            return
+        self._exec_built = True
+        exec_frame = self.exec_frame
+
         # Progress Bar
         self.progress_bar = ctk.CTkProgressBar(
             exec_frame,
@@ -301,7 +303,7 @@ class PipelineTab:
         self.step_label = ctk.CTkLabel(
             exec_frame,
             text="Ready",
-            font=ctk.CTkFont(**BODY_FONT)
+            font=get_font(BODY_FONT)
         )
         self.step_label.pack(padx=10, pady=(0, 10), anchor="w")
 
@@ -309,23 +311,50 @@ class PipelineTab:
         ctk.CTkLabel(
             exec_frame,
             text="Output Log:",
-            font=ctk.CTkFont(**HEADING_FONT)
+            font=get_font(HEADING_FONT)
         ).pack(padx=10, pady=(10, 5), anchor="w")
 
-        self.log_text = ctk.CTkTextbox(
-            exec_frame,
-            width=940,
-            height=300,
-            font=ctk.CTkFont(**MONO_FONT),
-            fg_color=COLORS['bg_primary'],  # Black background for log
-            border_color=COLORS['ui_frame'],  # Dark border
-            border_width=1
+        # Plain tk.Text holding only the visible slice of the log (see _render_log_view)
+        log_container = ctk.CTkFrame(exec_frame, fg_color=COLORS['bg_primary'])
+        log_container.pack(padx=10, pady=(0, 10), fill="both", expand=True)
+
+        self.log_scrollbar = ctk.CTkScrollbar(log_container, command=self._on_log_scrollbar)
+        self.log_scrollbar.pack(side="right", fill="y")
+
+        self._log_font = get_font(MONO_FONT)
+        self.log_text = tk.Text(
+            log_container,
+            height=20,
+            font=self._log_font,
+            bg=COLORS['bg_primary'],  # Black background for log
+            fg=COLORS['text_primary'],
+            highlightthickness=1,
+            highlightbackground=COLORS['ui_frame'],  # Dark border
+            highlightcolor=COLORS['ui_frame'],
+            borderwidth=0,
+            wrap="none",  # One buffered line per display line
+            state="disabled",
+            undo=False, maxundo=0, autoseparators=False,  # Log needs no undo history
+            spacing1=0, spacing2=0, spacing3=0  # No extra per-line layout work
         )
-        self.log_text.pack(padx=10, pady=(0, 10), fill="both", expand=True)
+        self.log_text.pack(side="left", fill="both", expand=True)
+        self.log_text.bind("<Configure>", lambda e: self._render_log_view())
+        self.log_text.bind("<MouseWheel>", self._on_log_wheel)
+        self.log_text.bind("<Button-4>", self._on_log_wheel)
+        self.log_text.bind("<Button-5>", self._on_log_wheel)
 
     def _update_frames_label(self, value):
-        """Update the frames per clip label when slider changes."""
-        self.frames_value_label.configure(text=str(int(float(value))))
+        """Update the frames per clip label when slider changes (debounced)."""
+        if self._slider_after_id is not None:
+            self.parent.after_cancel(self._slider_after_id)
+        self._slider_after_id = self.parent.after(
+            40, self._apply_frames_label, int(float(value))
+        )
+
+    def _apply_frames_label(self, value: int):
+        """Show the latest slider value in the frames per clip label."""
+        self._slider_after_id = None
+        self.frames_value_label.configure(text=str(value))
 
     def _browse_clips(self):
         """Browse for clips directory."""
@@ -347,10 +376,17 @@ class PipelineTab:
             self.detection_dir_var.set(path)
 
     def _update_default_paths(self):
-        """Update default frames and detection paths based on clips directory."""
-        clips_path = Path(self.clips_dir_var.get())
-        self.frames_dir_var.set(str(clips_path / ".pipeline_output" / "frames"))
-        self.detection_dir_var.set(str(clips_path / ".pipeline_output" / "detection_csvs"))
+        """Update default frames and detection paths based on clips directory.
+
+        The directory vars carry no per-keystroke UI work (their only traces
+        clear the ensured-dirs cache); values are read when the pipeline is
+        started, so both paths are computed first and assigned back to back.
+        """
+        output_path = Path(self.clips_dir_var.get()) / ".pipeline_output"
+        frames_dir = str(output_path / "frames")
+        detection_dir = str(output_path / "detection_csvs")
+        self.frames_dir_var.set(frames_dir)
+        self.detection_dir_var.set(detection_dir)
 
     # Pipeline stage weights for overall progress tracking
     PIPELINE_STAGES = {
@@ -359,19 +395,115 @@ class PipelineTab:
         "Wrote": {"weight": 0.10, "range": (0.90, 1.0)},                 # 90-100%
     }
 
-    def _append_log(self, text: str):
-        """Thread-safe log append."""
-        self.log_text.after(0, lambda: self._append_log_sync(text))
+    # The textbox is redrawn from the in-memory log at most every LOG_REFRESH_MS,
+    # so per-refresh work is bounded by LOG_MAX_LINES however much is printed
+    LOG_MAX_LINES = 2000
+    LOG_REFRESH_MS = 100
+    LOG_DRAIN_MS = 50
 
-    def _append_log_sync(self, text: str):
-        """Append text to log (must be called from main thread)."""
-        self.log_text.insert("end", text + "\n")
-        self.log_text.see("end")
+    def _append_log(self, text: str):
+        """Thread-safe log append of one or more lines (rendered on the next refresh tick)."""
+        self._log_lines.extend(text.split("\n"))
+        self._log_dirty = True
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            self.parent.after(self.LOG_REFRESH_MS, self._refresh_log)
+
+    def _refresh_log(self):
+        """Redraw the log viewport if new lines arrived (main thread)."""
+        # Clear flags first so lines appended during the redraw schedule another tick
+        self._refresh_scheduled = False
+        if not self._log_dirty:
+            return
+        self._log_dirty = False
+        self._render_log_view()
+
+    def _visible_log_lines(self) -> int:
+        """Number of log lines that fit in the log viewport."""
+        linespace = self._log_font.metrics("linespace") or 1
+        return max(1, self.log_text.winfo_height() // linespace)
+
+    def _render_log_view(self):
+        """Show only the slice of the buffered log that fits in the viewport."""
+        total = len(self._log_lines)
+        visible = self._visible_log_lines()
+        max_start = max(0, total - visible)
+        self._log_start = max_start if self._log_follow else min(self._log_start, max_start)
+        lines = list(islice(self._log_lines, self._log_start, self._log_start + visible))
+
+        self.log_text.configure(state="normal")
+        self._clear_log_text()
+        self.log_text.insert("1.0", "\n".join(lines))
+        self.log_text.configure(state="disabled")
+
+        if total:
+            self.log_scrollbar.set(self._log_start / total, min(1.0, (self._log_start + visible) / total))
+        else:
+            self.log_scrollbar.set(0.0, 1.0)
+
+    def _scroll_log_to(self, start: int):
+        """Move the log viewport; scrolling to the bottom resumes tail-follow."""
+        max_start = max(0, len(self._log_lines) - self._visible_log_lines())
+        self._log_start = max(0, min(start, max_start))
+        self._log_follow = self._log_start >= max_start
+        self._render_log_view()
+
+    def _on_log_wheel(self, event):
+        """Scroll the log viewport with the mouse wheel / trackpad."""
+        if event.num == 4:
+            step = -3
+        elif event.num == 5:
+            step = 3
+        elif abs(event.delta) >= 120:
+            step = -int(event.delta / 120) * 3  # Windows reports multiples of 120
+        else:
+            step = -event.delta  # macOS reports small deltas
+        self._scroll_log_to(self._log_start + step)
+        return "break"
+
+    def _on_log_scrollbar(self, action, *args):
+        """Translate scrollbar commands ("moveto"/"scroll") into viewport moves."""
+        if action == "moveto":
+            start = int(float(args[0]) * len(self._log_lines))
+        else:
+            amount, what = int(args[0]), args[1]
+            step = self._visible_log_lines() if what == "pages" else 1
+            start = self._log_start + amount * step
+        self._scroll_log_to(start)
+
+    def _drain_runner_log(self):
+        """Move batches of queued runner output into the log until the run ends."""
+        runner = self.runner
+        if runner is None:
+            return
+        # Read the exit code before draining: all output was queued before it was set
+        return_code = self._exit_code
+        text = runner.drain_log()
+        if text:
+            self._append_log(text)
+        if runner.has_pending_log():
+            self.parent.after(self.LOG_DRAIN_MS, self._drain_runner_log)
+        elif return_code is not None:
+            self._exit_code = None
+            self._finish_run(return_code)
+        elif self.is_running:
+            self.parent.after(self.LOG_DRAIN_MS, self._drain_runner_log)
+
+    def _clear_log(self):
+        """Empty both the buffered log and the log view."""
+        self._log_lines.clear()
+        self._log_dirty = False
+        self._log_start = 0
+        self._log_follow = True
+        self._render_log_view()
+
+    def _clear_log_text(self):
+        """Delete the log text contents, skipping the relayout when already empty."""
+        if self.log_text.index("end-1c") != "1.0":
+            self.log_text.delete("1.0", "end")
 
     def _update_progress(self, line: str):
         """Parse tqdm progress and scale to overall pipeline progress."""
-        import re
-
         # Detect current stage from output line
         current_stage = None
         for stage_name in self.PIPELINE_STAGES:
@@ -386,12 +518,12 @@ class PipelineTab:
         stage_progress = 0.0
 
         # Try percentage match
-        pct_match = re.search(r'(\d+)%', line)
+        pct_match = PROGRESS_PCT_RE.search(line)
         if pct_match:
             stage_progress = int(pct_match.group(1)) / 100.0
         else:
             # Try fraction match
-            frac_match = re.search(r'(\d+)/(\d+)', line)
+            frac_match = PROGRESS_FRAC_RE.search(line)
             if frac_match:
                 current = int(frac_match.group(1))
                 total = int(frac_match.group(2))
@@ -412,38 +544,80 @@ class PipelineTab:
         self.progress_bar.after(0, lambda: self.progress_bar.set(value))
 
     def _on_completion(self, return_code: int):
-        """Handle pipeline completion."""
+        """Record the exit code for the drain tick (called on the runner thread)."""
+        self._exit_code = return_code
+
+    def _finish_run(self, return_code: int):
+        """Apply the final run state after all of its output is logged (main thread)."""
         self.is_running = False
+        if return_code == 0 and self._pending_run_key:
+            self._save_last_run_key(self._pending_run_key)
+        self._pending_run_key = None
+
+        # Work out the final state first, then apply all widget updates back to back
+        if return_code == 0:
+            step_text = "Pipeline completed successfully!"
+            log_text = "\n=== Pipeline completed successfully ==="
+        else:
+            step_text = f"Pipeline failed with exit code {return_code}"
+            log_text = f"\n=== Pipeline failed with exit code {return_code} ==="
+
         self.run_button.configure(state="normal")
         self.cancel_button.configure(state="disabled")
-
+        self.step_label.configure(text=step_text)
         if return_code == 0:
-            self.step_label.configure(text="Pipeline completed successfully!")
             self.progress_bar.set(1.0)
-            self._append_log("\n=== Pipeline completed successfully ===")
-        else:
-            self.step_label.configure(text=f"Pipeline failed with exit code {return_code}")
-            self._append_log(f"\n=== Pipeline failed with exit code {return_code} ===")
+        self._append_log(log_text)
+
+        # Let Tk lay out the batch in one idle pass
+        self.parent.after_idle(self.parent.update_idletasks)
 
     def _run_pipeline(self):
         """Execute the pipeline with current configuration."""
         if self.is_running:
             return
 
+        self._ensure_exec_widgets()
+
+        # Clear log from any previous run
+        self._clear_log()
+
+        # Read each form value once; they are only consulted at submit time
+        clips_dir = self.clips_dir_var.get()
+        frames_dir = self.frames_dir_var.get()
+        detection_dir = self.detection_dir_var.get()
+
         # Validate clips directory exists
-        clips_path = Path(self.clips_dir_var.get())
-        if not clips_path.exists():
-            self._append_log(f"Error: Clips directory does not exist: {clips_path}")
+        if not os.path.isdir(clips_dir):
+            self._append_log(f"Error: Clips directory does not exist: {clips_dir}")
             return
 
-        # Create output directories before running pipeline
-        frames_path = Path(self.frames_dir_var.get())
-        detection_path = Path(self.detection_dir_var.get())
+        # Skip the subprocess entirely if this exact configuration already completed
+        run_config = {
+            'clips_dir': clips_dir,
+            'frames_dir': frames_dir,
+            'detection_dir': detection_dir,
+            'extensions': self.extensions_var.get(),
+            'frames_per_clip': self.frames_per_clip_var.get(),
+            'frame_workers': self.frame_workers_var.get(),
+            'classify_workers': self.classify_workers_var.get(),
+        }
+        run_key = self._run_key(run_config)
+        force = self.force_var.get()
+        if (not force and run_key == self._load_last_run_key()
+                and os.path.exists(os.path.join(detection_dir, "animals_in_videos.csv"))):
+            self._append_log("Outputs are up to date for these settings; skipping pipeline run.\n"
+                             "Check 'Force re-run' to run it again.")
+            self._finish_run(0)
+            return
 
+        # Create output directories before running pipeline
         try:
-            frames_path.mkdir(parents=True, exist_ok=True)
-            detection_path.mkdir(parents=True, exist_ok=True)
-            self._append_log(f"Created output directories:\n  - {frames_path}\n  - {detection_path}\n")
+            if not {frames_dir, detection_dir} <= self._ensured_dirs:
+                os.makedirs(frames_dir, exist_ok=True)
+                os.makedirs(detection_dir, exist_ok=True)
+                self._ensured_dirs.update((frames_dir, detection_dir))
+                self._append_log(f"Created output directories:\n  - {frames_dir}\n  - {detection_dir}\n")
         except Exception as e:
             self._append_log(f"Error: Failed to create output directories: {e}")
             return
@@ -452,24 +626,19 @@ class PipelineTab:
         cmd = [
             sys.executable,
             "run_pipeline.py",
+            "--clips_dir", clips_dir,
+            "--frames_dir", frames_dir,
+            "--detection_dir", detection_dir,
+            "--frames_per_clip", str(run_config['frames_per_clip']),
+            "--frames_workers", str(run_config['frame_workers']),
+            "--classify_workers", str(run_config['classify_workers']),
+            "--exts", run_config['extensions'],
         ]
 
-        # Add arguments
-        cmd.extend([
-            "--clips_dir", self.clips_dir_var.get(),
-            "--frames_dir", self.frames_dir_var.get(),
-            "--detection_dir", self.detection_dir_var.get(),
-            "--frames_per_clip", str(self.frames_per_clip_var.get()),
-            "--frames_workers", str(self.frame_workers_var.get()),
-            "--classify_workers", str(self.classify_workers_var.get()),
-            "--exts", self.extensions_var.get(),
-        ])
-
-        if self.force_var.get():
+        if force:
             cmd.append("--force")
 
-        # Clear log and reset progress
-        self.log_text.delete("1.0", "end")
+        # Reset progress
         self.progress_bar.set(0)
         self.step_label.configure(text="Starting pipeline...")
 
@@ -479,15 +648,44 @@ class PipelineTab:
         self.cancel_button.configure(state="normal")
 
         # Log command
-        self._append_log(f"Running command: {' '.join(cmd)}\n")
+        self._append_log("Running command: " + shlex.join(cmd))
 
         # Run in background
+        self._pending_run_key = run_key
+        self._exit_code = None
         self.runner = ProcessRunner(
             log_callback=self._append_log,
             progress_callback=self._update_progress,
-            completion_callback=self._on_completion
+            progress_markers=tuple(self.PIPELINE_STAGES),
+            completion_callback=self._on_completion,
+            bulk_log=True
         )
         self.runner.run(cmd)
+        self.parent.after(self.LOG_DRAIN_MS, self._drain_runner_log)
+
+    @staticmethod
+    def _run_key(run_config: dict) -> str:
+        """Stable hash of the settings that determine pipeline outputs."""
+        return hashlib.sha1(json.dumps(run_config, sort_keys=True).encode()).hexdigest()
+
+    @staticmethod
+    def _load_last_run_key():
+        """Return the key of the last successful run, or None."""
+        try:
+            with open(LAST_RUN_PATH, 'r') as f:
+                return json.load(f).get('key')
+        except (json.JSONDecodeError, OSError, AttributeError):
+            return None
+
+    @staticmethod
+    def _save_last_run_key(run_key: str):
+        """Persist the key of a successful run."""
+        try:
+            LAST_RUN_PATH.parent.mkdir(parents=True, exist_ok=True)
+            with open(LAST_RUN_PATH, 'w') as f:
+                json.dump({'key': run_key, 'rc': 0}, f)
+        except OSError:
+            pass  # Silent fail if can't write
 
     def _cancel_pipeline(self):
         """Cancel running pipeline."""
@@ -496,5 +694,6 @@ class PipelineTab:
             self._append_log("\n=== Cancelling pipeline ===")
             self.runner.cancel()
             self.is_running = False
+            self._pending_run_key = None
             self.run_button.configure(state="normal")
             self.cancel_button.configure(state="disabled")
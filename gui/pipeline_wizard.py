@@ -1,16 +1,35 @@
 """Pipeline wizard - full modal wizard for new analysis setup."""
 
+import os
+import queue
+import shlex
 import sys
+import threading
 import customtkinter as ctk
 from tkinter import filedialog, messagebox
 from pathlib import Path
-from gui.process_runner import ProcessRunner
+from typing import Dict
+from gui.process_runner import ProcessRunner, PROGRESS_PCT_RE, PROGRESS_FRAC_RE
+from gui.fonts import get_font
 from gui.config import (
     DEFAULT_CONFIG, get_worker_options, FRAMES_PER_CLIP_RANGE,
     TITLE_FONT, HEADING_FONT, BODY_FONT, MONO_FONT, COLORS
 )
 
 
+# Video file extensions counted when validating the clips directory (lowercase)
+VIDEO_EXTS = ('.mp4', '.mov', '.avi')
+
+# The run log keeps only this many most recent lines
+MAX_LOG_LINES = 5000
+
+# Interval at which queued log text is written to the textbox (main thread)
+LOG_FLUSH_MS = 50
+
+# Worker count choices as option menu labels (computed once at import)
+WORKER_STR_OPTIONS = tuple(str(w) for w in get_worker_options())
+
+
 class PipelineWizard(ctk.CTkToplevel):
     """Wizard for pipeline setup and execution."""
 
@@ -28,6 +47,7 @@ class PipelineWizard(ctk.CTkToplevel):
         self.completion_callback = completion_callback
         self.runner = None
         self.current_step = 1
+        self._step_frames: Dict[int, ctk.CTkFrame] = {}  # Built once, then re-shown
 
         # Form variables
         self.clips_dir_var = ctk.StringVar(value=DEFAULT_CONFIG['clips_dir'])
@@ -39,6 +59,14 @@ class PipelineWizard(ctk.CTkToplevel):
         self.classify_workers_var = ctk.IntVar(value=DEFAULT_CONFIG['classify_workers'])
         self.force_var = ctk.BooleanVar(value=DEFAULT_CONFIG['force'])
 
+        # has-outputs result per clips directory; cleared when a run may change it
+        self._outputs_cache: Dict[str, bool] = {}
+        self.force_var.trace_add("write", lambda *_: self._outputs_cache.clear())
+
+        # Log text queued from the runner thread, flushed to the textbox in batches
+        self._log_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+        self.log_text = None  # Created with step 3
+
         # Window configuration
         self.title("Analysis Wizard")
         self.geometry("900x700")
@@ -61,35 +89,43 @@ class PipelineWizard(ctk.CTkToplevel):
         # Show first step
         self._show_step1_directory()
 
+        # Poll the log queue from the main thread; the runner thread never touches Tk
+        self.after(LOG_FLUSH_MS, self._flush_log)
+
     def _show_step1_directory(self):
         """Step 1: Select clips directory and detect existing outputs."""
-        self._clear_container()
-        self.current_step = 1
+        self._show_step(1, self._build_step1)
+
+    def _build_step1(self, frame):
+        """Create the step 1 widgets (once).
 
+        Args:
+            frame: Step frame to build into
+        """
         # Title
         ctk.CTkLabel(
-            self.container,
+            frame,
             text="Step 1: Select Clips Directory",
-            font=ctk.CTkFont(**TITLE_FONT),
+            font=get_font(TITLE_FONT),
             text_color=COLORS['text_primary']
         ).pack(pady=(0, 10))
 
         # Description
         ctk.CTkLabel(
-            self.container,
+            frame,
             text="Choose the folder containing your trail camera video clips",
-            font=ctk.CTkFont(**BODY_FONT),
+            font=get_font(BODY_FONT),
             text_color=COLORS['text_primary']
         ).pack(pady=(0, 20))
 
         # Directory selection
-        dir_frame = ctk.CTkFrame(self.container, fg_color=COLORS['bg_primary'])
+        dir_frame = ctk.CTkFrame(frame, fg_color=COLORS['bg_primary'])
         dir_frame.pack(fill="x", pady=10)
 
         ctk.CTkLabel(
             dir_frame,
             text="Clips Directory:",
-            font=ctk.CTkFont(**BODY_FONT)
+            font=get_font(BODY_FONT)
         ).grid(row=0, column=0, sticky="w", padx=10, pady=10)
 
         self.clips_entry = ctk.CTkEntry(
@@ -115,9 +151,9 @@ class PipelineWizard(ctk.CTkToplevel):
 
         # Status area
         self.step1_status = ctk.CTkLabel(
-            self.container,
+            frame,
             text="Select a directory to continue",
-            font=ctk.CTkFont(**BODY_FONT),
+            font=get_font(BODY_FONT),
             text_color=COLORS['text_primary'],
             wraplength=800,
             justify="left"
@@ -125,7 +161,7 @@ class PipelineWizard(ctk.CTkToplevel):
         self.step1_status.pack(pady=20)
 
         # Navigation buttons
-        nav_frame = ctk.CTkFrame(self.container, fg_color=COLORS['bg_primary'])
+        nav_frame = ctk.CTkFrame(frame, fg_color=COLORS['bg_primary'])
         nav_frame.pack(side="bottom", pady=20)
 
         cancel_btn = ctk.CTkButton(
@@ -169,10 +205,67 @@ class PipelineWizard(ctk.CTkToplevel):
             self._validate_step1()
 
     def _validate_step1(self):
-        """Validate clips directory and update status."""
-        clips_path = Path(self.clips_dir_var.get())
+        """Validate clips directory in the background and update status."""
+        path = self.clips_dir_var.get()
+
+        # Show feedback right away; slow or network drives can take a while to list
+        self.step1_status.configure(
+            text="Scanning directory...",
+            text_color=COLORS['text_primary']
+        )
+        self.step1_continue_btn.configure(state="disabled")
 
-        if not clips_path.exists():
+        threading.Thread(target=self._scan_clips_dir, args=(path,), daemon=True).start()
+
+    def _scan_clips_dir(self, path: str):
+        """Count clips and check for outputs (runs on a worker thread, no Tk calls).
+
+        Args:
+            path: Clips directory to scan
+        """
+        exists = os.path.isdir(path)
+        video_count = 0
+        has_outputs = False
+        if exists:
+            # Count video files in one directory pass (DirEntry caches the file type)
+            try:
+                with os.scandir(path) as it:
+                    for entry in it:
+                        if entry.name[-4:].lower() in VIDEO_EXTS and entry.is_file():
+                            video_count += 1
+            except OSError:
+                pass  # Unreadable directory is reported as having no clips
+            has_outputs = self._has_outputs(path)
+
+        self.after(0, self._apply_scan_result, path, exists, video_count, has_outputs)
+
+    def _has_outputs(self, path: str) -> bool:
+        """Return whether pipeline outputs exist for a clips directory (cached).
+
+        Args:
+            path: Clips directory
+        """
+        if path not in self._outputs_cache:
+            self._outputs_cache[path] = self.session_manager.csv_path_for(path).exists()
+        return self._outputs_cache[path]
+
+    def _apply_scan_result(self, path: str, exists: bool, video_count: int, has_outputs: bool):
+        """Show the result of a clips directory scan (main thread).
+
+        Args:
+            path: Directory that was scanned
+            exists: Whether the directory exists
+            video_count: Number of video files found
+            has_outputs: Whether pipeline outputs exist for the directory
+        """
+        # Ignore results for a wizard/step that is gone or a directory no longer selected
+        if (not self.winfo_exists() or not self.step1_status.winfo_exists()
+                or path != self.clips_dir_var.get()):
+            return
+
+        clips_path = Path(path)
+
+        if not exists:
             self.step1_status.configure(
                 text="Directory does not exist",
                 text_color="#ff5555"  # Bright red for visibility
@@ -183,13 +276,7 @@ class PipelineWizard(ctk.CTkToplevel):
         # Update session manager
         self.session_manager.set_clips_directory(clips_path)
 
-        # Count video files
-        video_exts = ['.mp4', '.MP4', '.mov', '.MOV', '.avi', '.AVI']
-        video_files = []
-        for ext in video_exts:
-            video_files.extend(list(clips_path.glob(f"*{ext}")))
-
-        if not video_files:
+        if not video_count:
             self.step1_status.configure(
                 text=f"No video files found in: {clips_path}",
                 text_color="#ff5555"  # Bright red for visibility
@@ -198,9 +285,9 @@ class PipelineWizard(ctk.CTkToplevel):
             return
 
         # Check for existing pipeline outputs
-        if self.session_manager.has_existing_outputs():
+        if has_outputs:
             self.step1_status.configure(
-                text=f"✓ Found {len(video_files)} video clips\n"
+                text=f"✓ Found {video_count} video clips\n"
                      f"✓ Pipeline outputs detected!\n\n"
                      f"You can skip analysis and start reviewing immediately,\n"
                      f"or re-run the pipeline with new settings.",
@@ -212,7 +299,7 @@ class PipelineWizard(ctk.CTkToplevel):
             )
         else:
             self.step1_status.configure(
-                text=f"✓ Found {len(video_files)} video clips\n\n"
+                text=f"✓ Found {video_count} video clips\n\n"
                      f"No pipeline outputs detected.\n"
                      f"Continue to configure and run analysis.",
                 text_color=COLORS['text_primary']
@@ -225,12 +312,13 @@ class PipelineWizard(ctk.CTkToplevel):
     def _step1_continue(self):
         """Continue from step 1 based on whether outputs exist."""
         # Update default paths
-        clips_path = Path(self.clips_dir_var.get())
+        clips_dir = self.clips_dir_var.get()
+        clips_path = Path(clips_dir)
         self.frames_dir_var.set(str(clips_path / ".pipeline_output" / "frames"))
         self.detection_dir_var.set(str(clips_path / ".pipeline_output" / "detection_csvs"))
 
-        # Check if we can skip pipeline
-        if self.session_manager.has_existing_outputs():
+        # Check if we can skip pipeline (result cached by the directory scan)
+        if self._has_outputs(clips_dir):
             # Outputs exist - offer to skip to review
             result = messagebox.askyesno(
                 "Pipeline Outputs Found",
@@ -249,20 +337,25 @@ class PipelineWizard(ctk.CTkToplevel):
 
     def _show_step2_settings(self):
         """Step 2: Configure pipeline settings."""
-        self._clear_container()
-        self.current_step = 2
+        self._show_step(2, self._build_step2)
 
+    def _build_step2(self, frame):
+        """Create the step 2 widgets (once).
+
+        Args:
+            frame: Step frame to build into
+        """
         # Title
         ctk.CTkLabel(
-            self.container,
+            frame,
             text="Step 2: Pipeline Settings",
-            font=ctk.CTkFont(**TITLE_FONT),
+            font=get_font(TITLE_FONT),
             text_color=COLORS['text_primary']
         ).pack(pady=(0, 10))
 
         # Settings frame with scroll
         settings_scroll = ctk.CTkScrollableFrame(
-            self.container,
+            frame,
             fg_color=COLORS['bg_primary'],
             height=400
         )
@@ -272,7 +365,7 @@ class PipelineWizard(ctk.CTkToplevel):
         self._create_pipeline_settings(settings_scroll)
 
         # Navigation buttons
-        nav_frame = ctk.CTkFrame(self.container, fg_color=COLORS['bg_primary'])
+        nav_frame = ctk.CTkFrame(frame, fg_color=COLORS['bg_primary'])
         nav_frame.pack(side="bottom", pady=20)
 
         back_btn = ctk.CTkButton(
@@ -331,13 +424,13 @@ class PipelineWizard(ctk.CTkToplevel):
         ctk.CTkLabel(
             frame_frame,
             text="Frames per Clip:",
-            font=ctk.CTkFont(**BODY_FONT)
+            font=get_font(BODY_FONT)
         ).pack(side="left", padx=10)
 
         frames_value = ctk.CTkLabel(
             frame_frame,
             text=str(self.frames_per_clip_var.get()),
-            font=ctk.CTkFont(**HEADING_FONT),
+            font=get_font(HEADING_FONT),
             width=30
         )
         frames_value.pack(side="left", padx=5)
@@ -364,16 +457,15 @@ class PipelineWizard(ctk.CTkToplevel):
         ctk.CTkLabel(
             worker_frame,
             text="Frame Workers:",
-            font=ctk.CTkFont(**BODY_FONT)
+            font=get_font(BODY_FONT)
         ).pack(side="left", padx=10)
 
-        worker_options = get_worker_options()
         frame_workers_border = ctk.CTkFrame(worker_frame, fg_color=COLORS['ui_border'], corner_radius=6)
         frame_workers_border.pack(side="left", padx=10)
         ctk.CTkOptionMenu(
             frame_workers_border,
             variable=self.frame_workers_var,
-            values=[str(w) for w in worker_options],
+            values=WORKER_STR_OPTIONS,
             width=98,
             fg_color=COLORS['bg_primary'],
             button_color=COLORS['ui_border'],
@@ -388,7 +480,7 @@ class PipelineWizard(ctk.CTkToplevel):
         ctk.CTkLabel(
             worker_frame,
             text="Classify Workers:",
-            font=ctk.CTkFont(**BODY_FONT)
+            font=get_font(BODY_FONT)
         ).pack(side="left", padx=20)
 
         classify_workers_border = ctk.CTkFrame(worker_frame, fg_color=COLORS['ui_border'], corner_radius=6)
@@ -396,7 +488,7 @@ class PipelineWizard(ctk.CTkToplevel):
         ctk.CTkOptionMenu(
             classify_workers_border,
             variable=self.classify_workers_var,
-            values=[str(w) for w in worker_options],
+            values=WORKER_STR_OPTIONS,
             width=98,
             fg_color=COLORS['bg_primary'],
             button_color=COLORS['ui_border'],
@@ -413,7 +505,7 @@ class PipelineWizard(ctk.CTkToplevel):
             parent,
             text="Force re-run even if outputs exist",
             variable=self.force_var,
-            font=ctk.CTkFont(**BODY_FONT),
+            font=get_font(BODY_FONT),
             fg_color=COLORS['text_secondary'],
             border_color=COLORS['text_secondary'],
             border_width=1,
@@ -424,20 +516,33 @@ class PipelineWizard(ctk.CTkToplevel):
 
     def _show_step3_run(self):
         """Step 3: Run pipeline."""
-        self._clear_container()
-        self.current_step = 3
+        self._show_step(3, self._build_step3)
+
+        # Reset state left over from a previous run (the frame is reused)
+        self.progress_bar.set(0)
+        self.run_status_label.configure(text="Ready to start")
+        self.log_text.delete("1.0", "end")
+
+        # Start pipeline immediately
+        self._run_pipeline()
 
+    def _build_step3(self, frame):
+        """Create the step 3 widgets (once).
+
+        Args:
+            frame: Step frame to build into
+        """
         # Title
         ctk.CTkLabel(
-            self.container,
+            frame,
             text="Step 3: Running Analysis",
-            font=ctk.CTkFont(**TITLE_FONT),
+            font=get_font(TITLE_FONT),
             text_color=COLORS['text_primary']
         ).pack(pady=(0, 10))
 
         # Progress bar
         self.progress_bar = ctk.CTkProgressBar(
-            self.container,
+            frame,
             width=800,
             fg_color=COLORS['bg_tertiary'],
             progress_color=COLORS['accent_neon']
@@ -447,26 +552,27 @@ class PipelineWizard(ctk.CTkToplevel):
 
         # Status label
         self.run_status_label = ctk.CTkLabel(
-            self.container,
+            frame,
             text="Ready to start",
-            font=ctk.CTkFont(**BODY_FONT)
+            font=get_font(BODY_FONT)
         )
         self.run_status_label.pack(padx=10, pady=10)
 
         # Log output
         self.log_text = ctk.CTkTextbox(
-            self.container,
+            frame,
             width=800,
             height=400,
-            font=ctk.CTkFont(**MONO_FONT),
+            font=get_font(MONO_FONT),
             fg_color=COLORS['bg_primary'],
             border_color=COLORS['ui_frame'],
-            border_width=1
+            border_width=1,
+            undo=False, maxundo=0, autoseparators=False  # Log needs no undo history
         )
         self.log_text.pack(padx=10, pady=10, fill="both", expand=True)
 
         # Buttons
-        button_frame = ctk.CTkFrame(self.container, fg_color=COLORS['bg_primary'])
+        button_frame = ctk.CTkFrame(frame, fg_color=COLORS['bg_primary'])
         button_frame.pack(side="bottom", pady=20)
 
         self.cancel_run_btn = ctk.CTkButton(
@@ -484,24 +590,22 @@ class PipelineWizard(ctk.CTkToplevel):
         self.cancel_run_btn.bind("<Enter>", lambda e: self.cancel_run_btn.configure(border_color=COLORS['accent_danger']) if self.cancel_run_btn.cget("state") == "normal" else None)
         self.cancel_run_btn.bind("<Leave>", lambda e: self.cancel_run_btn.configure(border_color=COLORS['ui_border']) if self.cancel_run_btn.cget("state") == "normal" else None)
 
-        # Start pipeline immediately
-        self._run_pipeline()
-
     def _run_pipeline(self):
         """Execute the pipeline."""
-        clips_path = Path(self.clips_dir_var.get())
-        if not clips_path.exists():
+        # Read each form variable once
+        clips_dir = self.clips_dir_var.get()
+        frames_dir = self.frames_dir_var.get()
+        detection_dir = self.detection_dir_var.get()
+
+        if not os.path.exists(clips_dir):
             messagebox.showerror("Error", "Clips directory does not exist", parent=self)
             return
 
         # Create output directories
-        frames_path = Path(self.frames_dir_var.get())
-        detection_path = Path(self.detection_dir_var.get())
-
         try:
-            frames_path.mkdir(parents=True, exist_ok=True)
-            detection_path.mkdir(parents=True, exist_ok=True)
-            self._append_log(f"Created output directories:\n  - {frames_path}\n  - {detection_path}\n")
+            os.makedirs(frames_dir, exist_ok=True)
+            os.makedirs(detection_dir, exist_ok=True)
+            self._append_log(f"Created output directories:\n  - {frames_dir}\n  - {detection_dir}\n")
         except Exception as e:
             self._append_log(f"Error creating directories: {e}")
             return
@@ -510,23 +614,19 @@ class PipelineWizard(ctk.CTkToplevel):
         cmd = [
             sys.executable,
             "run_pipeline.py",
-        ]
-
-        # Add arguments
-        cmd.extend([
-            "--clips_dir", self.clips_dir_var.get(),
-            "--frames_dir", self.frames_dir_var.get(),
-            "--detection_dir", self.detection_dir_var.get(),
+            "--clips_dir", clips_dir,
+            "--frames_dir", frames_dir,
+            "--detection_dir", detection_dir,
             "--frames_per_clip", str(self.frames_per_clip_var.get()),
             "--frames_workers", str(self.frame_workers_var.get()),
             "--classify_workers", str(self.classify_workers_var.get()),
             "--exts", self.extensions_var.get(),
-        ])
+        ]
 
         if self.force_var.get():
             cmd.append("--force")
 
-        self._append_log(f"Running: {' '.join(cmd)}\n\n")
+        self._append_log(f"Running: {shlex.join(cmd)}\n\n")
         self.run_status_label.configure(text="Running pipeline...")
         self.cancel_run_btn.configure(state="normal")
 
@@ -534,6 +634,7 @@ class PipelineWizard(ctk.CTkToplevel):
         self.runner = ProcessRunner(
             log_callback=self._append_log,
             progress_callback=self._update_progress,
+            progress_markers=tuple(self.PIPELINE_STAGES),
             completion_callback=self._on_pipeline_complete
         )
         self.runner.run(cmd)
@@ -546,14 +647,36 @@ class PipelineWizard(ctk.CTkToplevel):
     }
 
     def _append_log(self, text: str):
-        """Append text to log."""
-        self.log_text.insert("end", text + "\n")
-        self.log_text.see("end")
+        """Queue text for the log; safe to call from the runner thread."""
+        self._log_queue.put(text + "\n")
+
+    def _flush_log(self):
+        """Write all queued log text with one insert, then reschedule (main thread)."""
+        if not self.winfo_exists():
+            return
+
+        # Leave text queued until step 3 has created the log
+        items = []
+        if self.log_text is not None:
+            try:
+                while True:
+                    items.append(self._log_queue.get_nowait())
+            except queue.Empty:
+                pass
+        if items:
+            self.log_text.insert("end", "".join(items))
+
+            # Drop the oldest lines so long runs don't grow the widget without bound
+            line_count = int(self.log_text.index("end-1c").split(".")[0])
+            if line_count > MAX_LOG_LINES:
+                self.log_text.delete("1.0", f"{line_count - MAX_LOG_LINES}.0")
+
+            self.log_text.see("end")
+
+        self.after(LOG_FLUSH_MS, self._flush_log)
 
     def _update_progress(self, line: str):
         """Parse tqdm progress and scale to overall pipeline progress."""
-        import re
-
         # Detect current stage from output line
         current_stage = None
         for stage_name in self.PIPELINE_STAGES:
@@ -568,12 +691,12 @@ class PipelineWizard(ctk.CTkToplevel):
         stage_progress = 0.0
 
         # Try percentage match
-        pct_match = re.search(r'(\d+)%', line)
+        pct_match = PROGRESS_PCT_RE.search(line)
         if pct_match:
             stage_progress = int(pct_match.group(1)) / 100.0
         else:
             # Try fraction match
-            frac_match = re.search(r'(\d+)/(\d+)', line)
+            frac_match = PROGRESS_FRAC_RE.search(line)
             if frac_match:
                 current = int(frac_match.group(1))
                 total = int(frac_match.group(2))
@@ -607,6 +730,7 @@ class PipelineWizard(ctk.CTkToplevel):
             return_code: Process return code
         """
         self.cancel_run_btn.configure(state="disabled")
+        self._outputs_cache.clear()  # The run may have created or replaced outputs
 
         if return_code == 0:
             self.progress_bar.set(1.0)
@@ -629,7 +753,21 @@ class PipelineWizard(ctk.CTkToplevel):
         self.destroy()
         self.completion_callback(skip_pipeline=False)
 
-    def _clear_container(self):
-        """Clear all widgets from container."""
-        for widget in self.container.winfo_children():
-            widget.destroy()
+    def _show_step(self, step: int, builder):
+        """Show a step's frame, building it on first visit, and hide the others.
+
+        Args:
+            step: Step number (1-3)
+            builder: Method that creates the step's widgets inside a frame
+        """
+        frame = self._step_frames.get(step)
+        if frame is None:
+            frame = ctk.CTkFrame(self.container, fg_color=COLORS['bg_primary'])
+            self._step_frames[step] = frame
+            builder(frame)
+
+        for other in self._step_frames.values():
+            if other is not frame:
+                other.pack_forget()
+        frame.pack(fill="both", expand=True)
+        self.current_step = step
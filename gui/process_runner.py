@@ -1,10 +1,34 @@
 """Process runner for executing subprocesses in the background without blocking the GUI."""
 
 import os
+import queue
+import re
+import signal
 import subprocess
 import threading
 from pathlib import Path
-from typing import List, Callable, Optional
+from typing import List, Callable, Optional, Sequence
+
+# Scripts like run_pipeline.py are resolved relative to the project root;
+# it cannot change at runtime, so resolve it once at import
+PROJECT_ROOT = str(Path(__file__).parent.parent)
+
+# Output is read in raw chunks of this size and split into lines locally
+READ_CHUNK_SIZE = 65536
+
+# Line endings as text mode would translate them (tqdm redraws with a bare \r)
+LINE_SPLIT = re.compile(rb"\r\n|\r|\n")
+
+# Progress patterns in tqdm-style output lines ("42%" or "21/50")
+PROGRESS_PCT_RE = re.compile(r"(\d+)%")
+PROGRESS_FRAC_RE = re.compile(r"(\d+)/(\d+)")
+
+# Start the pipeline in its own process group so cancel() also reaches the
+# worker processes it spawns, without ever signalling the GUI's own group
+if os.name == 'nt':
+    GROUP_KW = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+else:
+    GROUP_KW = {'start_new_session': True}
 
 
 class ProcessRunner:
@@ -12,21 +36,32 @@ class ProcessRunner:
 
     def __init__(self, log_callback: Callable[[str], None],
                  progress_callback: Optional[Callable[[dict], None]] = None,
-                 completion_callback: Optional[Callable[[int], None]] = None):
+                 completion_callback: Optional[Callable[[int], None]] = None,
+                 bulk_log: bool = False,
+                 progress_markers: Optional[Sequence[str]] = None):
         """
         Initialize the process runner.
 
         Args:
-            log_callback: Function to call with each line of output
+            log_callback: Function to call with output (a batch of newline-joined lines)
             progress_callback: Optional function to call with progress updates
             completion_callback: Optional function to call when process completes (with exit code)
+            bulk_log: If True, output lines are queued instead of passed to log_callback;
+                the caller collects them in batches with drain_log()
+            progress_markers: Optional substrings that progress lines contain; only the
+                last line of a batch containing one is passed to progress_callback
         """
         self.log_callback = log_callback
+        self.bulk_log = bulk_log
+        self.progress_markers = tuple(progress_markers) if progress_markers else None
+        self.log_queue: "queue.SimpleQueue[str]" = queue.SimpleQueue()
         self.progress_callback = progress_callback
         self.completion_callback = completion_callback
         self.process: Optional[subprocess.Popen] = None
         self.thread: Optional[threading.Thread] = None
         self.cancelled = False
+        # Environment with unbuffered Python output, built once per runner
+        self._env = {**os.environ, 'PYTHONUNBUFFERED': '1'}
 
     def run(self, command: List[str]):
         """
@@ -34,7 +69,12 @@ class ProcessRunner:
 
         Args:
             command: List of command arguments (e.g., ['python3', 'script.py', '--arg', 'value'])
+
+        Raises:
+            RuntimeError: If a previous run's reader thread is still active
         """
+        if self.thread is not None and self.thread.is_alive():
+            raise RuntimeError("ProcessRunner is already running")
         self.cancelled = False
         self.thread = threading.Thread(target=self._run_process, args=(command,), daemon=True)
         self.thread.start()
@@ -46,69 +86,179 @@ class ProcessRunner:
         Args:
             command: Command to execute
         """
-        # Create environment with unbuffered Python output
-        env = os.environ.copy()
-        env['PYTHONUNBUFFERED'] = '1'
-
         # Use project root as working directory
-        cwd = str(Path(__file__).parent.parent)
+        cwd = PROJECT_ROOT
 
         try:
             self.process = subprocess.Popen(
                 command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,  # Merge stderr into stdout
-                bufsize=1,
-                universal_newlines=True,
-                env=env,
-                cwd=cwd
+                bufsize=0,  # Unbuffered: output is read straight from the fd below
+                env=self._env,
+                cwd=cwd,
+                **GROUP_KW
             )
 
-            # Read line by line
-            for line in iter(self.process.stdout.readline, ''):
-                if self.cancelled:
+            # Read in large raw chunks and hand complete lines over in batches
+            fd = self.process.stdout.fileno()
+            read, split, dispatch = os.read, LINE_SPLIT.split, self._dispatch_lines
+            buf = b""
+            while not self.cancelled:
+                chunk = read(fd, READ_CHUNK_SIZE)
+                if not chunk:
                     break
+                # Most chunks end on a line break, so usually there is no tail to prepend
+                data = buf + chunk if buf else chunk
+                # A trailing \r may be the first half of \r\n, so keep it for the next chunk
+                hold = b"\r" if data.endswith(b"\r") else b""
+                parts = split(data[:-1] if hold else data)
+                buf = parts.pop() + hold
+                if parts:
+                    dispatch(parts)
 
-                if line:
-                    # Update GUI log (callback should handle thread-safety)
-                    self.log_callback(line.rstrip())
+            # Flush a final line that had no trailing newline
+            if buf.rstrip(b"\r") and not self.cancelled:
+                self._dispatch_lines([buf.rstrip(b"\r")])
 
-                    # Parse progress if callback provided
-                    if self.progress_callback:
-                        # Progress callback can parse tqdm or other progress formats
-                        self.progress_callback(line.rstrip())
-
-            # Wait for process to complete
-            return_code = self.process.wait()
+            # Wait for process to complete; after a cancel, don't hang on a child
+            # that ignores SIGTERM
+            if self.cancelled:
+                try:
+                    return_code = self.process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._signal_group(terminate=False)
+                    return_code = self.process.wait()
+            else:
+                return_code = self.process.wait()
 
             # Notify completion
             if self.completion_callback and not self.cancelled:
                 self.completion_callback(return_code)
 
         except Exception as e:
-            self.log_callback(f"Error running process: {e}")
+            self._emit(f"Error running process: {e}")
             if self.completion_callback:
                 self.completion_callback(-1)
 
+        finally:
+            # Release the pipe fd now rather than when the Popen is collected
+            if self.process is not None and self.process.stdout is not None:
+                self.process.stdout.close()
+
     def cancel(self):
-        """Gracefully stop running process."""
+        """Gracefully stop running process.
+
+        Does not join the reader thread: cancel() runs on the GUI thread, and the
+        reader may be inside a callback waiting on it. Once cancelled, the reader
+        stops dispatching after its current batch and skips completion_callback.
+        """
         self.cancelled = True
         if self.process:
             try:
                 # Try graceful termination first
-                self.process.terminate()
+                self._signal_group(terminate=True)
 
                 # Wait up to 5 seconds for graceful shutdown
                 try:
                     self.process.wait(timeout=5)
-                    self.log_callback("Process terminated gracefully")
+                    self._emit("Process terminated gracefully")
                 except subprocess.TimeoutExpired:
                     # Force kill if still running
-                    self.process.kill()
-                    self.log_callback("Process forcefully killed")
+                    self._signal_group(terminate=False)
+                    self._emit("Process forcefully killed")
 
             except Exception as e:
-                self.log_callback(f"Error cancelling process: {e}")
+                self._emit(f"Error cancelling process: {e}")
+
+    def _signal_group(self, terminate: bool):
+        """Terminate or kill the process together with its children.
+
+        Args:
+            terminate: True for a graceful stop, False to force kill
+        """
+        if os.name == 'nt':
+            if terminate:
+                self.process.send_signal(signal.CTRL_BREAK_EVENT)
+            else:
+                self.process.kill()
+        else:
+            # The child leads its own session, so its pid is the group id
+            try:
+                os.killpg(self.process.pid, signal.SIGTERM if terminate else signal.SIGKILL)
+            except ProcessLookupError:
+                pass  # The whole group has already exited
+
+    def _dispatch_lines(self, raw_lines: List[bytes]):
+        """Decode a batch of output lines and pass it to the log and progress callbacks.
+
+        Args:
+            raw_lines: Complete lines without line endings
+        """
+        # LINE_SPLIT already removed the line endings, so no rstrip() pass is needed
+        lines = [raw.decode('utf-8', errors='replace') for raw in raw_lines]
+
+        # Update GUI log (callback should handle thread-safety)
+        if self.bulk_log:
+            put = self.log_queue.put
+            for line in lines:
+                put(line)
+            text = None
+        else:
+            text = "\n".join(lines)
+            self.log_callback(text)
+
+        # Runs without progress tracking are done here
+        progress_callback = self.progress_callback
+        if progress_callback is None:
+            return
+
+        markers = self.progress_markers
+        if markers:
+            # One substring scan over the whole batch before any per-line progress parsing
+            if text is None:
+                text = "\n".join(lines)
+            if not any(m in text for m in markers):
+                return
+
+            # Only the newest progress line in the batch matters; earlier
+            # tqdm redraws would be overwritten immediately anyway
+            for line in reversed(lines):
+                if any(m in line for m in markers):
+                    progress_callback(line)
+                    break
+        else:
+            # Progress callback can parse tqdm or other progress formats
+            for line in lines:
+                progress_callback(line)
+
+    def _emit(self, line: str):
+        """Route one log line to the queue (bulk mode) or the log callback."""
+        if self.bulk_log:
+            self.log_queue.put(line)
+        else:
+            self.log_callback(line)
+
+    def drain_log(self, max_lines: int = 256) -> str:
+        """Pop up to max_lines queued log lines (bulk mode).
+
+        Args:
+            max_lines: Maximum number of lines to take in one call
+
+        Returns:
+            Lines joined with newlines, or an empty string if none are queued
+        """
+        lines = []
+        try:
+            for _ in range(max_lines):
+                lines.append(self.log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        return "\n".join(lines)
+
+    def has_pending_log(self) -> bool:
+        """Check if queued log lines are waiting to be drained."""
+        return not self.log_queue.empty()
 
     def is_running(self) -> bool:
         """Check if process is currently running."""
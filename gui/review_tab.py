@@ -53,6 +53,11 @@ class ReviewTab:
         self.progress_var = ctk.DoubleVar(value=0.0)
         self.was_playing_before_settings = False  # Track video state before settings open
 
+        # Preference changes mark the session dirty so closing knows to save
+        if self.session_manager:
+            for var in (self.speed_var, self.pause_duration_var):
+                var.trace_add("write", lambda *_: self.session_manager.mark_dirty())
+
         # Auto-hide controls state
         self.controls_visible = True
         self.auto_hide_timer = None
@@ -1116,8 +1121,9 @@ class ReviewTab:
         self.search_has_focus = False
 
     def _should_execute_shortcut(self) -> bool:
-        """Check if shortcuts should execute (not in search box)."""
-        return self.shortcuts_enabled_globally and not self.search_has_focus
+        """Check if shortcuts should execute (not in search box, screen visible)."""
+        return (self.shortcuts_enabled_globally and not self.search_has_focus
+                and self.main_frame.winfo_ismapped())
 
     def _on_shortcuts_toggle(self):
         """Update global shortcuts enabled state."""
@@ -1457,6 +1463,17 @@ class ReviewTab:
             "• Session-based progress tracking"
         )
 
+    def refresh_preferences(self, preferences: dict):
+        """Apply saved preferences to an existing review tab.
+
+        Args:
+            preferences: Dictionary with 'play_rate' and 'clip_pause_seconds'
+        """
+        play_rate = preferences.get('play_rate', DEFAULT_CONFIG['play_rate'])
+        self.speed_var.set(play_rate)
+        self.pause_duration_var.set(preferences.get('clip_pause_seconds', DEFAULT_CONFIG['clip_pause_seconds']))
+        self._update_speed(play_rate)
+
     def _get_preferences(self) -> dict:
         """Get current user preferences for state persistence.
 
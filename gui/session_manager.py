@@ -3,7 +3,7 @@
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 from appdirs import user_config_dir
 
 
@@ -15,6 +15,13 @@ class SessionManager:
         self.current_clip_index: int = 0
         self.clips_directory: Optional[Path] = None
         self.csv_path: Optional[Path] = None
+        self.dirty: bool = False  # True when in-memory state differs from disk
+        # Called with the new clips directory (or None) whenever it changes
+        self.on_clips_directory_changed: Optional[Callable[[Optional[Path]], None]] = None
+
+    def mark_dirty(self):
+        """Flag that state or preferences changed since the last save."""
+        self.dirty = True
 
     def set_clips_directory(self, directory: Path):
         """Set the clips directory and derive CSV path.
@@ -23,7 +30,26 @@ class SessionManager:
             directory: Path to clips directory
         """
         self.clips_directory = Path(directory)
-        self.csv_path = self.clips_directory / ".pipeline_output" / "detection_csvs" / "animals_in_videos.csv"
+        self.csv_path = self.csv_path_for(self.clips_directory)
+        self.dirty = True
+        self._notify_clips_directory()
+
+    def _notify_clips_directory(self):
+        """Invoke the directory-change callback, if one is registered."""
+        if self.on_clips_directory_changed:
+            self.on_clips_directory_changed(self.clips_directory)
+
+    @staticmethod
+    def csv_path_for(directory: Path) -> Path:
+        """Return the pipeline output CSV path for a clips directory.
+
+        Args:
+            directory: Path to clips directory
+
+        Returns:
+            Path to animals_in_videos.csv under the directory's pipeline outputs
+        """
+        return Path(directory) / ".pipeline_output" / "detection_csvs" / "animals_in_videos.csv"
 
     def save_clip_index(self, index: int):
         """Update current clip index.
@@ -31,7 +57,9 @@ class SessionManager:
         Args:
             index: Current clip index (0-based)
         """
-        self.current_clip_index = index
+        if index != self.current_clip_index:
+            self.current_clip_index = index
+            self.dirty = True
 
     def get_last_state(self) -> dict:
         """Return last session state.
@@ -60,6 +88,8 @@ class SessionManager:
         self.current_clip_index = 0
         self.clips_directory = None
         self.csv_path = None
+        self.dirty = True
+        self._notify_clips_directory()
 
     def _get_config_path(self) -> Path:
         """Get platform-appropriate config file path.
@@ -141,6 +171,7 @@ class SessionManager:
         try:
             with open(config_path, 'w') as f:
                 json.dump(state, f, indent=2)
+            self.dirty = False
         except OSError:
             pass  # Silent fail if can't write
 
@@ -158,6 +189,7 @@ class SessionManager:
         clips_dir = session.get('clips_directory')
         if clips_dir:
             self.clips_directory = Path(clips_dir)
+            self._notify_clips_directory()
 
         self.current_clip_index = session.get('current_clip_index', 0)
 
@@ -37,15 +37,15 @@ def get_clean_env():
 
 
 def find_backend_script():
-    """Find video_backend.py script.
+    """Find backend_bootstrap.py script (entry point for video_backend).
 
     Returns:
-        Path to video_backend.py
+        Path to backend_bootstrap.py
     """
-    script_path = Path(__file__).parent / "video_backend.py"
+    script_path = Path(__file__).parent / "backend_bootstrap.py"
     if script_path.exists():
         return script_path
-    raise FileNotFoundError("Could not find video_backend.py")
+    raise FileNotFoundError("Could not find backend_bootstrap.py")
 
 
 def start_backend():